@@ -0,0 +1,82 @@
+# Compare and time the detail field extractor against the previous one on
+# saved pages. Usage: python bench_detail.py [runs] [page.html ...]
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+from bongthom_detail import _clean_text, _extract_fields
+
+
+def _legacy_fields(soup: BeautifulSoup) -> dict:
+    """The previous extractor: separate selects and repeated get_text per row."""
+    detail = {key: "" for key in (
+        "industry", "salary", "employment_type", "experience", "education", "closing_date",
+        "description", "requirements", "contact_email", "contact_phone",
+    )}
+    soup.get_text()
+    for row in soup.select("div[class*='info'], tr, .job-info, .job-information, li, p"):
+        text = row.get_text(strip=True).lower()
+        if "industry" in text:
+            field = "industry"
+        elif "salary" in text or "income" in text:
+            field = "salary"
+        elif "employment" in text:
+            field = "employment_type"
+        elif "experience" in text and "require" in text:
+            field = "experience"
+        elif "education" in text or "qualification" in text:
+            field = "education"
+        elif "closing" in text or "deadline" in text:
+            field = "closing_date"
+        else:
+            continue
+        parts = row.get_text(separator=" ", strip=True).split(":", 1)
+        if len(parts) == 2:
+            detail[field] = parts[1].strip() or detail[field]
+
+    for elem in soup.select("p, div[class*='description'], div[class*='detail'], div[class*='content']"):
+        desc_text = _clean_text(elem)
+        if len(desc_text) > 50 and "N/A" not in desc_text:
+            detail["description"] = desc_text
+            break
+
+    for req_section in soup.select("ul, ol"):
+        lis = [li.get_text(strip=True) for li in req_section.select("li")]
+        if lis:
+            detail["requirements"] = "\n".join(lis[:10])
+            break
+
+    for link in soup.select("a[href^='mailto:'], a[href^='tel:']"):
+        href = link.get("href", "").lower()
+        text = link.get_text(strip=True)
+        if "mailto:" in href and not detail["contact_email"]:
+            detail["contact_email"] = text or href.replace("mailto:", "")
+        elif "tel:" in href and not detail["contact_phone"]:
+            detail["contact_phone"] = text or href.replace("tel:", "")
+    return {key: value for key, value in detail.items() if value}
+
+
+def _single_pass(soup: BeautifulSoup) -> dict:
+    return {key: value for key, value in _extract_fields(soup).items() if value}
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    paths = sys.argv[2:] or ["debug_page.html"]
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            soup = BeautifulSoup(f.read(), "html.parser")
+
+        same = _legacy_fields(soup) == _single_pass(soup)
+        old = timeit.timeit(lambda: _legacy_fields(soup), number=runs) / runs
+        new = timeit.timeit(lambda: _single_pass(soup), number=runs) / runs
+
+        print(path)
+        print(f"  Output matches previous extractor: {'yes' if same else 'NO'}")
+        print(f"  Previous extractor: {old * 1000:8.2f} ms")
+        print(f"  Single pass:        {new * 1000:8.2f} ms  ({old / new:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
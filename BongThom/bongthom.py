@@ -1,12 +1,73 @@
-from bongthom_list import scrape_job_cards
-from bongthom_detail import scrape_all_details
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from bongthom_list import (
+    CARD_HASH_FIELDS, LIST_CSV, SEEN_IDS_FILE, scrape_job_cards, scrape_job_cards_http,
+)
+from bongthom_detail import (
+    DETAIL_FIELDS, DETAILS_CSV, scrape_all_details, scrape_job_detail,
+)
+
+# Make the repo-level ``common`` package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.cli import add_common_args, apply_common_args
+from common.http_cache import replay_enabled
+from common.http_session import make_session
+from common.scraper import Scraper
+from common.seen_store import Watermark
+
+
+class BongThomScraper(Scraper):
+    name = "bongthom"
+    fields = DETAIL_FIELDS
+    list_csv = LIST_CSV
+    detail_csv = DETAILS_CSV
+    seen_file = SEEN_IDS_FILE
+    card_fields = CARD_HASH_FIELDS
+
+    def __init__(self) -> None:
+        self._session = None
+
+    def iter_listings(self, watermark: Optional[Watermark] = None) -> Iterator[Dict]:
+        # Plain HTTP first; the Selenium walk is only needed if pages require JS
+        basics = scrape_job_cards_http(max_pages=1500, watermark=watermark)
+        if not basics and not replay_enabled():
+            basics = scrape_job_cards(max_scrolls=1500, delay=2.5, watermark=watermark)
+        yield from basics
+
+    def fetch_detail(self, listing: Dict) -> Optional[Dict]:
+        if self._session is None:
+            self._session = make_session(1)
+        return scrape_job_detail(listing, self._session)
+
+    def fetch_details(self, listings: List[Dict], resume: bool = False,
+                      refresh: Iterable[str] = ()) -> int:
+        return scrape_all_details(listings, resume=resume, refresh=refresh)
 
 def main():
-    basics = scrape_job_cards(max_scrolls=1500, delay=2.5)
-    if not basics:
-        print("No jobs collected — detail step skipped.")
-        return
-    scrape_all_details(basics)
+    parser = argparse.ArgumentParser(description="Scrape BongThom job listings and details.")
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="reuse the saved job list and only fetch details missing from the CSV",
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="keep existing detail rows; fetch only new jobs and jobs whose card changed",
+    )
+    parser.add_argument(
+        "--stop-after", type=int, default=0, metavar="N",
+        help="with --incremental, stop paging after N consecutive already-known jobs",
+    )
+    add_common_args(parser)
+    args = parser.parse_args()
+    if args.stop_after and not args.incremental:
+        parser.error("--stop-after only applies to --incremental runs")
+    apply_common_args(args)
+
+    BongThomScraper().run(resume=args.resume, incremental=args.incremental, stop_after=args.stop_after)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
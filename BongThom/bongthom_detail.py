@@ -1,20 +1,20 @@
 # bongthom_detail.py
-import csv
+import re
+import sys
 import time
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Accept-Language": "en-US,en;q=0.9",
-}
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+# Make the repo-level ``common`` package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.csv_sink import CsvSink
+from common.http_session import DETAIL_CONCURRENCY, DETAIL_MAX_RPS, fetch_all, make_session
+
+DETAILS_CSV = "bongthom_jobs_details.csv"
 
 DETAIL_FIELDS = [
     "id",
@@ -38,27 +38,147 @@ DETAIL_FIELDS = [
 ]
 
 
+# Label keywords that classify an info row, found in one scan of its text.
+# The lookahead lets overlapping keywords all be reported.
+ROW_KEYWORD_RE = re.compile(
+    r"(?=(industry|salary|income|employment|experience|require|education"
+    r"|qualification|closing|deadline))"
+)
+
+# First matching rule wins, mirroring the order rows were checked in before
+ROW_RULES = [
+    ("industry", ("industry",), ()),
+    ("salary", ("salary", "income"), ()),
+    ("employment_type", ("employment",), ()),
+    ("experience", ("experience",), ("require",)),
+    ("education", ("education", "qualification"), ()),
+    ("closing_date", ("closing", "deadline"), ()),
+]
+
+# Strings `Tag.get_text` counts for ordinary tags (script/style/comments are skipped)
+_TEXT_TYPES = (NavigableString, CData)
+
+
 def _clean_text(node) -> str:
     if not node:
         return "N/A"
     return node.get_text(separator="\n", strip=True)
 
 
-def _make_session() -> requests.Session:
-    session = requests.Session()
-    retry = Retry(
-        total=3,
-        backoff_factor=0.8,
-        status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=False,
-    )
-    session.mount("https://", HTTPAdapter(max_retries=retry))
-    return session
+def _classify_row(text: str):
+    """Field a lower-cased row text is labelled as, or None."""
+    found = set(ROW_KEYWORD_RE.findall(text))
+    if not found:
+        return None
+    for field, any_of, all_of in ROW_RULES:
+        if found.intersection(any_of) and found.issuperset(all_of):
+            return field
+    return None
+
+
+def _index_page(soup: BeautifulSoup) -> Dict:
+    """Walk the page once, recording where each interesting element's text lives.
+
+    Every stripped text node goes into ``strings``; rows, description
+    candidates, the first list with items and contact links are kept as
+    ``[start, end)`` spans into it, so their text can be joined later without
+    walking the tree again.
+    """
+    strings: List[str] = []
+    rows, descriptions, items, links = [], [], [], []
+    req_list = None
+    stack = []  # (tag, span) for the tags enclosing the current node
+
+    for node in soup.descendants:
+        parent = node.parent
+        while stack and stack[-1][0] is not parent:
+            stack.pop()[1][1] = len(strings)
+
+        if not isinstance(node, Tag):
+            if type(node) in _TEXT_TYPES:
+                text = node.strip()
+                if text:
+                    strings.append(text)
+            continue
+
+        span = [len(strings), None]
+        stack.append((node, span))
+        name = node.name
+        classes = node.get("class") or []
+        class_attr = " ".join(classes) if isinstance(classes, list) else classes
+
+        if (name in ("tr", "li", "p")
+                or (name == "div" and "info" in class_attr)
+                or "job-info" in classes or "job-information" in classes):
+            rows.append(span)
+
+        if name == "p" or (name == "div" and any(
+                key in class_attr for key in ("description", "detail", "content"))):
+            descriptions.append(span)
+
+        if name == "li":
+            if req_list is None:
+                # The outermost open list is the first one on the page with items
+                req_list = next((s for tag, s in stack if tag.name in ("ul", "ol")), None)
+            if req_list is not None and req_list[1] is None and len(items) < 10:
+                items.append(span)
+
+        if name == "a":
+            href = node.get("href", "")
+            if href.startswith("mailto:") or href.startswith("tel:"):
+                links.append((href.lower(), span))
+
+    while stack:
+        stack.pop()[1][1] = len(strings)
+
+    return {
+        "strings": strings,
+        "rows": rows,
+        "descriptions": descriptions,
+        "items": items,
+        "links": links,
+    }
+
+
+def _extract_fields(soup: BeautifulSoup) -> Dict[str, str]:
+    """Detail fields found on the page; missing ones are left out."""
+    index = _index_page(soup)
+    strings = index["strings"]
+    fields: Dict[str, str] = {}
+
+    for start, end in index["rows"]:
+        field = _classify_row("".join(strings[start:end]).lower())
+        if not field:
+            continue
+        parts = " ".join(strings[start:end]).split(":", 1)
+        if len(parts) == 2 and parts[1].strip():
+            fields[field] = parts[1].strip()
+
+    # Description: the first block with some real content
+    for start, end in index["descriptions"]:
+        desc_text = "\n".join(strings[start:end])
+        if len(desc_text) > 50 and "N/A" not in desc_text:
+            fields["description"] = desc_text
+            break
+
+    # Requirements: items of the first list on the page, 10 at most
+    if index["items"]:
+        fields["requirements"] = "\n".join("".join(strings[start:end]) for start, end in index["items"])
+
+    # Contact info (emails and phones)
+    for href, (start, end) in index["links"]:
+        text = "".join(strings[start:end])
+        if "mailto:" in href and not fields.get("contact_email"):
+            fields["contact_email"] = text or href.replace("mailto:", "")
+        elif "tel:" in href and not fields.get("contact_phone"):
+            fields["contact_phone"] = text or href.replace("tel:", "")
+
+    return fields
 
 
 def scrape_job_detail(job: Dict, session: requests.Session) -> Dict:
     url = job["url"]
-    resp = session.get(url, headers=HEADERS, timeout=20)
+    resp = session.get(url, timeout=20)
     resp.raise_for_status()
 
     soup = BeautifulSoup(resp.text, "html.parser")
@@ -85,80 +205,9 @@ def scrape_job_detail(job: Dict, session: requests.Session) -> Dict:
         "location": job.get("location", ""),
     }
 
-    # Try to find info rows in multiple common formats
-    # Look for divs or spans containing job info
-    all_text_content = soup.get_text()
-    
-    # Try common selectors for job details
-    info_rows = soup.select("div[class*='info'], tr, .job-info, .job-information, li, p")
-    
-    for row in info_rows:
-        text = row.get_text(strip=True).lower()
-        
-        # Extract field-value pairs from common patterns
-        if "industry" in text:
-            match_text = row.get_text(separator=" ", strip=True)
-            parts = match_text.split(":", 1)
-            if len(parts) == 2:
-                detail["industry"] = parts[1].strip() or detail["industry"]
-                
-        elif "salary" in text or "income" in text:
-            match_text = row.get_text(separator=" ", strip=True)
-            parts = match_text.split(":", 1)
-            if len(parts) == 2:
-                detail["salary"] = parts[1].strip() or detail["salary"]
-                
-        elif ("employment" in text or "type of employment" in text) and "N/A" not in text.lower():
-            match_text = row.get_text(separator=" ", strip=True)
-            parts = match_text.split(":", 1)
-            if len(parts) == 2:
-                detail["employment_type"] = parts[1].strip() or detail["employment_type"]
-                
-        elif "experience" in text and "require" in text:
-            match_text = row.get_text(separator=" ", strip=True)
-            parts = match_text.split(":", 1)
-            if len(parts) == 2:
-                detail["experience"] = parts[1].strip() or detail["experience"]
-                
-        elif "education" in text or "qualification" in text:
-            match_text = row.get_text(separator=" ", strip=True)
-            parts = match_text.split(":", 1)
-            if len(parts) == 2:
-                detail["education"] = parts[1].strip() or detail["education"]
-                
-        elif ("closing" in text or "deadline" in text or "closing date" in text):
-            match_text = row.get_text(separator=" ", strip=True)
-            parts = match_text.split(":", 1)
-            if len(parts) == 2:
-                detail["closing_date"] = parts[1].strip() or detail["closing_date"]
-
-    # Try to find description (look for longer paragraphs)
-    potential_desc = soup.select("p, div[class*='description'], div[class*='detail'], div[class*='content']")
-    if potential_desc:
-        for elem in potential_desc:
-            desc_text = _clean_text(elem)
-            if len(desc_text) > 50 and "N/A" not in desc_text:  # Get longer content
-                detail["description"] = desc_text
-                break
-
-    # Try to find requirements
-    req_sections = soup.select("ul, ol")
-    if req_sections:
-        for req_section in req_sections:
-            lis = [li.get_text(strip=True) for li in req_section.select("li")]
-            if lis and len(lis) > 0:
-                detail["requirements"] = "\n".join(lis[:10])  # First 10 items max
-                break
-
-    # Try to find contact info (emails and phones)
-    all_links = soup.select("a[href^='mailto:'], a[href^='tel:']")
-    for link in all_links:
-        href = link.get("href", "").lower()
-        text = link.get_text(strip=True)
-        if "mailto:" in href and not detail["contact_email"]:
-            detail["contact_email"] = text or href.replace("mailto:", "")
-        elif "tel:" in href and not detail["contact_phone"]:
-            detail["contact_phone"] = text or href.replace("tel:", "")
+    # Fill the remaining fields from a single walk over the page
+    for field, value in _extract_fields(soup).items():
+        detail[field] = value or detail[field]
 
     # Convert empty strings back to "N/A" for consistency
     for key in detail:
@@ -168,26 +217,52 @@ def scrape_job_detail(job: Dict, session: requests.Session) -> Dict:
     return detail
 
 
-def scrape_all_details(jobs: List[Dict], pause: float = 1.5) -> List[Dict]:
-    session = _make_session()
-    detailed: List[Dict] = []
+def scrape_all_details(
+    jobs: List[Dict],
+    concurrency: int = DETAIL_CONCURRENCY,
+    max_rps: float = DETAIL_MAX_RPS,
+    resume: bool = False,
+    refresh: Iterable[str] = (),
+    output_file: str = DETAILS_CSV,
+) -> int:
+    """Fetch job details ``concurrency`` at a time, at most ``max_rps`` per host.
 
+    Rows are appended to ``output_file`` in the order of ``jobs`` as they
+    arrive; failed jobs are skipped with a warning. With ``resume`` the jobs
+    already in the file are not fetched again, except the IDs in ``refresh``
+    whose old rows are dropped first. Returns the rows in the file.
+    """
+    sink = CsvSink(output_file, DETAIL_FIELDS, key="id", resume=resume, drop=refresh)
+    pending = [job for job in jobs if job["id"] not in sink]
+    if len(pending) < len(jobs):
+        print(f"[INFO] Skipping {len(jobs) - len(pending)} jobs already in {output_file}")
+
+    session = make_session(concurrency)
+    total = len(pending)
+
+    def fetch(job: Dict) -> Optional[Dict]:
+        try:
+            return scrape_job_detail(job, session)
+        except Exception as exc:
+            print(f"  [WARN] Failed {job['id']}: {exc}")
+            return None
+
+    fetched = 0
+    started = time.monotonic()
     try:
-        for idx, job in enumerate(jobs, 1):
-            print(f"[{idx}/{len(jobs)}] Fetching job {job['id']}")
-            try:
-                detail = scrape_job_detail(job, session)
-                detailed.append(detail)
-            except Exception as exc:
-                print(f"  [WARN] Failed {job['id']}: {exc}")
-            time.sleep(pause)
+        for _, _, detail in fetch_all(pending, fetch, lambda job: job["url"], concurrency, max_rps):
+            if detail:
+                sink.write(detail)
+                fetched += 1
+    except BaseException:
+        sink.close(commit=False)  # keep the previous CSV if this run dies
+        raise
     finally:
         session.close()
+        sink.close()
 
-    with open("bongthom_jobs_details.csv", "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=DETAIL_FIELDS)
-        writer.writeheader()
-        writer.writerows(detailed)
-
-    print(f"[DONE] Saved {len(detailed)} detailed jobs to bongthom_jobs_details.csv")
-    return detailed
\ No newline at end of file
+    elapsed = time.monotonic() - started
+    print(f"[INFO] Fetched {fetched}/{total} details in {elapsed:.1f}s "
+          f"({total / max(elapsed, 1e-6):.1f} jobs/s)")
+    print(f"[DONE] Saved {sink.rows} detailed jobs to {output_file}")
+    return sink.rows
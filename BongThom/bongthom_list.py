@@ -2,20 +2,32 @@
 import csv
 import os
 import re
+import shutil
+import sys
+import tempfile
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
+import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import ActionChains
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+
+# Make the repo-level ``common`` package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.driver_factory import create_driver
+from common.http_cache import replay_enabled
+from common.http_session import make_session
+from common.lean_profile import TrafficMeter
+from common.seen_store import Watermark
 
 BASE_URL = "https://www.bongthom.com"
 JOBS_URL = f"{BASE_URL}/job_list.html"
@@ -30,6 +42,21 @@ CARD_LOCATORS = [
 
 JOB_LINK_SELECTOR = "ul.bt-list.job-list > li a[href*='/job_detail/']"  # Updated for BongThom
 
+LIST_CSV = "bongthom_jobs_list.csv"
+# Card fields whose change means a posting was edited and needs re-fetching
+SEEN_IDS_FILE = "bongthom_seen_ids.json"
+CARD_HASH_FIELDS = ("title", "company", "posted_raw")
+LIST_FIELDS = ["id", "title", "company", "location", "posted_raw", "url", "source"]
+
+# Listing pages fetched at once by the plain-HTTP crawler
+LIST_WORKERS = 6
+
+# Serialized job list(s) of the current page, fetched with a single WebDriver call
+JOB_LIST_HTML_JS = (
+    "return Array.from(document.querySelectorAll('ul.bt-list.job-list'))"
+    ".map(function (ul) { return ul.outerHTML; }).join('');"
+)
+
 LOAD_MORE_LOCATORS = [
     (By.XPATH, "//a[@class='page-link' and not(contains(@class,'disabled'))]//following::li[1]//a"),  # Next page button
     (By.CSS_SELECTOR, "li.page-item.page-next:not(.disabled) a.page-link"),  # Next pagination button
@@ -46,25 +73,7 @@ IFRAME_LOCATORS = [
 
 
 def setup_driver(headless: bool = False) -> webdriver.Chrome:
-    options = Options()
-    options.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--start-maximized")
-    if headless:
-        options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.execute_script(
-        "Object.defineProperty(navigator, 'webdriver', {get: () => false});"
-    )
-    return driver
+    return create_driver(headless=headless, profile="bongthom")
 
 
 def _enter_job_frame(driver: webdriver.Chrome, wait: WebDriverWait) -> None:
@@ -169,9 +178,13 @@ def _find_load_more(driver: webdriver.Chrome):
     return None
 
 
-def _extract_job(anchor, seen_ids: set) -> Dict:
+def _extract_job(li, seen_ids: set) -> Dict:
+    """Job record from one parsed ``li`` card, or {} if it isn't a new job."""
     try:
-        href = anchor.get_attribute("href") or ""
+        anchor = li.select_one("a[href*='/job_detail/']")
+        if anchor is None:
+            return {}
+        href = anchor.get("href") or ""
         # Updated regex to match BongThom's URL pattern: /job_detail/..._ID.html
         match = re.search(r"/job_detail/.*_(\d+)\.html", href)
         if not match:
@@ -183,12 +196,7 @@ def _extract_job(anchor, seen_ids: set) -> Dict:
         if job_id in seen_ids:
             return {}
 
-        # Get the parent list item
-        try:
-            li = anchor.find_element(By.XPATH, "./ancestor::li[1]")
-            soup = BeautifulSoup(li.get_attribute("outerHTML"), "html.parser")
-        except:
-            soup = BeautifulSoup(anchor.get_attribute("outerHTML"), "html.parser")
+        soup = li
 
         # Extract data from BongThom's structure
         # Title is in h5 tag inside span
@@ -222,9 +230,229 @@ def _extract_job(anchor, seen_ids: set) -> Dict:
         return {}
 
 
-def scrape_job_cards(max_scrolls: int = 200, delay: float = 2.5) -> List[Dict]:
+def _parse_job_cards(list_html: str, seen_ids: set) -> List[Dict]:
+    """All new job records in a chunk of job-list HTML; updates ``seen_ids``."""
+    soup = BeautifulSoup(list_html, "html.parser")
+    jobs: List[Dict] = []
+    for li in soup.select("ul.bt-list.job-list > li"):
+        job = _extract_job(li, seen_ids)
+        if not job:
+            continue
+        seen_ids.add(job["id"])
+        job["url"] = urljoin(BASE_URL, job["url"].lstrip("/"))
+        jobs.append(job)
+    return jobs
+
+
+def _save_jobs_csv(jobs: List[Dict], output_file: str = LIST_CSV) -> None:
+    if jobs:
+        # Use temp file to avoid permission issues
+        temp_fd, temp_path = tempfile.mkstemp(suffix='.csv', text=True)
+        try:
+            with os.fdopen(temp_fd, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=LIST_FIELDS)
+                writer.writeheader()
+                writer.writerows(jobs)
+            
+            # Replace the original file with the temp file
+            if os.path.exists(output_file):
+                os.remove(output_file)
+            shutil.move(temp_path, output_file)
+            print(f"[SUCCESS] Saved {len(jobs)} jobs to {output_file}")
+        except Exception as e:
+            print(f"[ERROR] Failed to write CSV: {e}")
+        finally:
+            # Clean up temp file if it still exists
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except:
+                    pass
+    else:
+        print("[INFO] No jobs collected")
+
+    print(f"[DONE] Saved {len(jobs)} job cards to {output_file}")
+
+
+def _fetch_page_jobs(session: requests.Session, page: int) -> Optional[List[Dict]]:
+    """Cards on ``job_list.html?page=N`` as served, or None if the request failed."""
+    try:
+        resp = session.get(f"{JOBS_URL}?page={page}", timeout=20)
+        resp.raise_for_status()
+    except requests.RequestException as exc:
+        print(f"[WARN] Page {page} failed over HTTP: {exc}")
+        return None
+    return _parse_job_cards(resp.text, set())
+
+
+class _ProbeFailed(Exception):
+    """A page needed to locate the end of the list couldn't be fetched."""
+
+
+def _find_last_page(probe, max_pages: int) -> int:
+    """Last page that still has cards, found by doubling then bisecting.
+
+    ``probe(page)`` returns True when the page has cards; page 1 is known to.
+    It raises `_ProbeFailed` when it can't tell, since guessing "empty"
+    would silently cut off every later page.
+    """
+    lo, hi = 1, 2
+    while hi <= max_pages and probe(hi):
+        lo, hi = hi, hi * 2
+    hi = min(hi, max_pages + 1)
+    # Invariant: page lo has cards, page hi doesn't (or is past max_pages)
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if probe(mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def _render_pages(pages: List[int]) -> Dict[int, List[Dict]]:
+    """Load pages the plain fetch couldn't read in Chrome and parse their cards."""
+    results: Dict[int, List[Dict]] = {}
+    if not pages:
+        return results
+    print(f"[INFO] Rendering {len(pages)} page(s) in the browser: {pages}")
+    driver = setup_driver(headless=False)
+    wait = WebDriverWait(driver, 25)
+    meter = TrafficMeter(driver, name="bongthom-list")
+    try:
+        for page in pages:
+            driver.get(f"{JOBS_URL}?page={page}")
+            try:
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.bt-list.job-list > li")))
+            except TimeoutException:
+                print(f"[WARN] Page {page} rendered no job cards")
+                continue
+            finally:
+                meter.page(f"Page {page}")
+            results[page] = _parse_job_cards(driver.execute_script(JOB_LIST_HTML_JS) or "", set())
+    finally:
+        if meter.enabled:
+            print(f"[INFO] Traffic: {meter.summary()}")
+        driver.quit()
+    return results
+
+
+def _crawl_to_watermark(
+    session: requests.Session,
+    fetched: Dict[int, Optional[List[Dict]]],
+    watermark: Watermark,
+    max_pages: int,
+    workers: int,
+) -> int:
+    """Fetch pages in order, ``workers`` at a time, until known jobs are reached.
+
+    Returns the last page to keep: the one where the watermark was reached,
+    or the last page with cards.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for start in range(1, max_pages + 1, workers):
+            window = range(start, min(start + workers, max_pages + 1))
+            todo = [page for page in window if page not in fetched]
+            for page, jobs in zip(todo, executor.map(lambda page: _fetch_page_jobs(session, page), todo)):
+                fetched[page] = jobs
+            for page in window:
+                jobs = fetched[page]
+                if jobs == []:
+                    return page - 1
+                if jobs and watermark.reached(job["id"] for job in jobs):
+                    print(f"[INFO] Reached jobs seen in earlier runs on page {page}; stopping")
+                    return page
+    return max_pages
+
+
+def scrape_job_cards_http(
+    max_pages: int = 200,
+    workers: int = LIST_WORKERS,
+    watermark: Optional[Watermark] = None,
+) -> List[Dict]:
+    """Crawl the listing pages over plain HTTP, ``workers`` pages at a time.
+
+    Returns [] when the served HTML carries no cards, ignores ``?page=`` or
+    a page needed to find the end of the list can't be fetched, so the
+    caller can fall back to `scrape_job_cards`. Pages that fail over
+    HTTP are rendered in Chrome. With a ``watermark`` pages are walked
+    newest first and the crawl stops once it is back among known jobs.
+    """
+    session = make_session(workers)
+    fetched: Dict[int, Optional[List[Dict]]] = {}
+
+    def page_jobs(page: int) -> Optional[List[Dict]]:
+        if page not in fetched:
+            fetched[page] = _fetch_page_jobs(session, page)
+        return fetched[page]
+
+    def has_cards(page: int) -> bool:
+        jobs = page_jobs(page)
+        if jobs is None:
+            raise _ProbeFailed(page)
+        return bool(jobs)
+
+    try:
+        first = page_jobs(1)
+        if not first:
+            print("[INFO] job_list.html has no server-rendered cards; using the browser")
+            return []
+        second = page_jobs(2)
+        if second is None:
+            print("[WARN] Page 2 failed over HTTP; using the browser")
+            return []
+        if second and not {job["id"] for job in second} - {job["id"] for job in first}:
+            print("[INFO] Server ignores ?page=; using the browser")
+            return []
+
+        if watermark is not None and second:
+            last_page = _crawl_to_watermark(session, fetched, watermark, max_pages, workers)
+        else:
+            try:
+                last_page = _find_last_page(has_cards, max_pages) if second else 1
+            except _ProbeFailed as exc:
+                print(f"[WARN] Page {exc} failed over HTTP, so the end of the list is unknown; "
+                      "using the browser")
+                return []
+            print(f"[INFO] {last_page} listing page(s); fetching with {workers} workers")
+
+            todo = [page for page in range(1, last_page + 1) if page not in fetched]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for page, jobs in zip(todo, executor.map(lambda page: _fetch_page_jobs(session, page), todo)):
+                    fetched[page] = jobs
+    finally:
+        session.close()
+
+    missing = [page for page in range(1, last_page + 1) if not fetched.get(page)]
+    if missing:
+        print(f"[WARN] {len(missing)} of {last_page} page(s) failed or came back empty over HTTP: {missing}")
+    if missing and replay_enabled():
+        print("[WARN] Replay mode: not rendering them; their jobs are missing from this run")
+    elif missing:
+        fetched.update(_render_pages(missing))
+        lost = [page for page in missing if not fetched.get(page)]
+        if lost:
+            print(f"[WARN] {len(lost)} page(s) still have no cards after rendering: {lost}")
+
+    jobs: List[Dict] = []
+    seen_ids: set = set()
+    for page in range(1, last_page + 1):
+        for job in fetched.get(page) or []:
+            if job["id"] not in seen_ids:
+                seen_ids.add(job["id"])
+                jobs.append(job)
+        print(f"Page {page}/{last_page} — total {len(jobs)}")
+
+    _save_jobs_csv(jobs)
+    return jobs
+
+
+def scrape_job_cards(
+    max_scrolls: int = 200, delay: float = 2.5, watermark: Optional[Watermark] = None
+) -> List[Dict]:
     driver = setup_driver(headless=False)
     wait = WebDriverWait(driver, 25)
+    meter = TrafficMeter(driver, name="bongthom-list")
 
     jobs: List[Dict] = []
     seen_ids: set = set()
@@ -243,27 +471,18 @@ def scrape_job_cards(max_scrolls: int = 200, delay: float = 2.5) -> List[Dict]:
         stagnant_loops = 0
 
         for scroll in range(max_scrolls):
-            # Find all li elements in the job list
-            li_elements = driver.find_elements(By.CSS_SELECTOR, "ul.bt-list.job-list > li")
-            
-            new_count = 0
-
-            for li in li_elements:
-                try:
-                    # Get the anchor element inside the li
-                    anchor = li.find_element(By.CSS_SELECTOR, "a[href*='/job_detail/']")
-                    job = _extract_job(anchor, seen_ids)
-                    if not job:
-                        continue
-                    seen_ids.add(job["id"])
-                    job["url"] = urljoin(BASE_URL, job["url"].lstrip("/"))
-                    jobs.append(job)
-                    new_count += 1
-                except Exception as e:
-                    continue
+            # Pull the whole job list in one round trip and parse it locally
+            page_jobs = _parse_job_cards(driver.execute_script(JOB_LIST_HTML_JS) or "", seen_ids)
+            jobs.extend(page_jobs)
+            new_count = len(page_jobs)
 
             total = len(jobs)
             print(f"Scroll {scroll+1}/{max_scrolls} (Page {current_page}) — new {new_count} | total {total}")
+            meter.page(f"Page {current_page}")
+
+            if watermark is not None and watermark.reached(job["id"] for job in page_jobs):
+                print("[INFO] Reached jobs seen in earlier runs; stopping.")
+                break
 
             if total == last_total:
                 stagnant_loops += 1
@@ -311,53 +530,9 @@ def scrape_job_cards(max_scrolls: int = 200, delay: float = 2.5) -> List[Dict]:
                     break
 
     finally:
+        if meter.enabled:
+            print(f"[INFO] Traffic: {meter.summary()}")
         driver.quit()
 
-    if jobs:
-        import tempfile
-        import shutil
-        
-        # Use temp file to avoid permission issues
-        temp_fd, temp_path = tempfile.mkstemp(suffix='.csv', text=True)
-        try:
-            with open(temp_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=[
-                        "id",
-                        "title",
-                        "company",
-                        "location",
-                        "posted_raw",
-                        "url",
-                        "source",
-                    ],
-                )
-                writer.writeheader()
-                writer.writerows(jobs)
-            
-            # Replace the original file with the temp file
-            output_file = "bongthom_jobs_list.csv"
-            if os.path.exists(output_file):
-                os.remove(output_file)
-            shutil.move(temp_path, output_file)
-            print(f"[SUCCESS] Saved {len(jobs)} jobs to {output_file}")
-        except Exception as e:
-            print(f"[ERROR] Failed to write CSV: {e}")
-            # At least try to close the temp file
-            try:
-                os.close(temp_fd)
-            except:
-                pass
-        finally:
-            # Clean up temp file if it still exists
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
-    else:
-        print("[INFO] No jobs collected")
-
-    print(f"[DONE] Saved {len(jobs)} job cards to bongthom_jobs_list.csv")
+    _save_jobs_csv(jobs)
     return jobs
\ No newline at end of file
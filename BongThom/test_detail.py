@@ -10,7 +10,7 @@ print(f'Testing on {len(jobs)} jobs...')
 for j in jobs:
     print(f"  - {j['id']}: {j['title'][:50]}")
 
-scrape_all_details(jobs, pause=1)
+scrape_all_details(jobs, concurrency=3)
 
 # Show results
 print("\n" + "="*80)
@@ -0,0 +1,59 @@
+# Micro-benchmark for the detail field extractor, run against the saved page
+# inspect_detail.py writes (inspect_detail.html). Usage: python bench_detail.py [runs]
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+from detail import _index_page, _lookup_label, _parse_detail_html
+
+LABELS = [
+    "Salary:", "Job Type:", "Job Level:", "Location:", "Industry:",
+    "Year of Experience:", "Experience:", "Qualification:", "Language:",
+    "Available Position:", "Gender:", "Age:", "Published date:",
+    "Closing date:", "Required Skills:",
+]
+
+
+def _per_label_scan(soup: BeautifulSoup) -> dict:
+    """The previous approach: one find_all("strong") scan per label."""
+    values = {}
+    for label in LABELS:
+        for strong in soup.find_all("strong"):
+            text = strong.get_text(strip=True)
+            if label.lower() in text.lower():
+                value = strong.parent.get_text(strip=True).replace(text, "", 1).strip()
+                if value:
+                    values[label] = value
+                    break
+    # The old language/company fallbacks walked the whole tree with get_text
+    soup.find(lambda tag: "language" in tag.get_text(strip=True).lower()[:20])
+    soup.find(lambda tag: tag.name in ("div", "span", "p")
+              and "company" in tag.get_text(strip=True).lower()[:30])
+    return values
+
+
+def _single_pass(soup: BeautifulSoup) -> dict:
+    index = _index_page(soup)
+    return {label: _lookup_label(index, label) for label in LABELS}
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with open("inspect_detail.html", encoding="utf-8") as f:
+        html = f.read()
+    soup = BeautifulSoup(html, "html.parser")
+
+    parse = timeit.timeit(lambda: BeautifulSoup(html, "html.parser"), number=runs) / runs
+    old = timeit.timeit(lambda: _per_label_scan(soup), number=runs) / runs
+    new = timeit.timeit(lambda: _single_pass(soup), number=runs) / runs
+    full = timeit.timeit(lambda: _parse_detail_html(soup, "1183"), number=runs) / runs
+
+    print(f"HTML parse (html.parser):   {parse * 1000:8.2f} ms")
+    print(f"Per-label scans + fallbacks: {old * 1000:8.2f} ms")
+    print(f"Single-pass label index:     {new * 1000:8.2f} ms  ({old / new:.1f}x faster)")
+    print(f"Full _parse_detail_html:     {full * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,29 @@
+import re
+import sys
 import time
-from typing import Dict, List
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+import requests
+from bs4 import BeautifulSoup, Tag
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
-from utils import BASE_URL, coalesce, fetch_json, make_session
+# Make the repo-level ``common`` package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.driver_factory import create_driver
+from common.http_cache import CacheMiss, replay_enabled
+from common.lean_profile import TrafficMeter
+from common.network_capture import NetworkCapture
+
+from driver_pool import DriverPool
+from nuxt import parse_nuxt_state
+from utils import BASE_URL, coalesce, fetch_html, fetch_json, make_session
 
 
 DETAIL_FIELDS: List[str] = [
@@ -40,6 +52,21 @@ DETAIL_FIELDS: List[str] = [
     "url",
 ]
 
+LANGUAGE_RE = re.compile(
+    r"(English|Khmer|Chinese|Japanese|Korean)[\s—\-]+(Advanced|Intermediate|Basic|Native)",
+    re.IGNORECASE,
+)
+
+# The detail template renders the same "How to apply" block for every job;
+# it is not part of the Nuxt payload.
+NUXT_HOW_TO_APPLY = (
+    "1. Please register Jobify Account\n"
+    "2. Click\n"
+    "create or upload CV\n"
+    "3. After creating your CV, apply for a job by clicking the "
+    "'Apply Now' button. Jobify will review your CV."
+)
+
 
 def _join_list(values) -> str:
     if isinstance(values, list):
@@ -84,290 +111,460 @@ def _flatten_detail(job_payload: Dict, url: str) -> Dict:
     }
 
 
-def _setup_driver(headless: bool = True) -> webdriver.Chrome:
-    """Set up Chrome WebDriver for Selenium."""
-    options = Options()
-    options.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+def _html_to_text(fragment: Optional[str]) -> str:
+    """Flatten a rich-text payload field like the page sections are collected."""
+    if not fragment:
+        return ""
+    soup = BeautifulSoup(fragment, "html.parser")
+    parts: List[str] = []
+    for elem in soup.find_all(["p", "ul", "ol"], recursive=False):
+        if elem.name == "p":
+            text = elem.get_text(strip=True)
+            if text and len(text) > 5:
+                parts.append(text)
+        else:
+            items = [li.get_text(strip=True) for li in elem.find_all("li", recursive=False)]
+            parts.extend(f"• {item}" for item in items if item)
+    if not parts:
+        return soup.get_text(separator="\n", strip=True)
+    return "\n".join(part for part in parts if len(part) > 3)
+
+
+def _format_nuxt_date(value) -> str:
+    """ISO timestamps from the payload -> 'January 5, 2026' as shown on the page."""
+    if not value:
+        return ""
+    try:
+        parsed = datetime.strptime(str(value)[:10], "%Y-%m-%d")
+    except ValueError:
+        return coalesce(str(value))
+    return f"{parsed:%B} {parsed.day}, {parsed.year}"
+
+
+def _nuxt_job(state: Dict) -> Optional[Dict]:
+    """Locate the job record inside a decoded ``__NUXT__`` state."""
+    job_post = (state.get("state") or {}).get("job_post") or {}
+    job = job_post.get("jobPostById")
+    if isinstance(job, dict) and job.get("job_title"):
+        return job
+    for block in (state.get("fetch") or {}).values():
+        job = block.get("job") if isinstance(block, dict) else None
+        if isinstance(job, dict) and job.get("job_title"):
+            return job
+    return None
+
+
+def _payload_from_nuxt(job: Dict, slug: str) -> Dict:
+    """Map a Nuxt job record onto the payload shape `_flatten_detail` expects."""
+    title = coalesce(job.get("job_title"))
+    if job.get("job_code"):
+        title = f"{title} ({coalesce(job['job_code'])})"
+
+    salary = coalesce(job.get("salary"))
+    if not salary and job.get("min_salary") is not None:
+        salary = f"${job['min_salary']} ~ ${job.get('max_salary')}"
+    if not salary and job.get("is_negotiable"):
+        salary = "Negotiable"
+
+    location = ", ".join(
+        coalesce(job.get(key)) for key in ("district", "city_province", "country") if coalesce(job.get(key))
     )
-    if headless:
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--start-maximized")
-
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.execute_script(
-        "Object.defineProperty(navigator, 'webdriver', {get: () => false});"
+    languages = ", ".join(
+        f"{coalesce(item.get('language'))} - {coalesce(item.get('lang_level'))}"
+        for item in job.get("languages") or []
+        if isinstance(item, dict) and item.get("language")
     )
-    return driver
-
-
-def _extract_label_value(soup: BeautifulSoup, label: str) -> str:
-    """Extract value after a label like 'Salary:', 'Job Type:', etc."""
-    # Find strong tag containing the label
-    strong_tags = soup.find_all("strong")
-    for strong in strong_tags:
-        text = strong.get_text(strip=True)
-        if label.lower() in text.lower():
-            # Get the parent element and extract all text, then remove the label
-            parent = strong.parent
-            if parent:
-                full_text = parent.get_text(strip=True)
-                # Remove the label part
-                value = full_text.replace(text, "", 1).strip()
-                if value:
-                    return value
-            # Alternative: get next sibling text
-            next_elem = strong.next_sibling
-            if next_elem:
-                value = str(next_elem).strip()
-                if value:
-                    return value
+    positions = job.get("available_position")
+    company_name = coalesce(job.get("company_name"))
+
+    return {
+        "id": slug,
+        "slug": slug,
+        "title": title,
+        "company": {"name": company_name} if company_name else {},
+        "salary": salary,
+        "jobType": coalesce(job.get("job_type")),
+        "jobLevel": coalesce(job.get("job_level")),
+        "location": location,
+        "industry": coalesce(job.get("industry")),
+        "experienceYears": coalesce(job.get("exp_year")),
+        "qualification": coalesce(job.get("qualification")),
+        "language": languages,
+        "numberOfPositions": f"{positions} pax" if positions else "",
+        "skills": [
+            coalesce(item.get("skill")) for item in job.get("skills") or []
+            if isinstance(item, dict) and coalesce(item.get("skill"))
+        ],
+        "genderRequirement": coalesce(job.get("gender")).title(),
+        "ageRequirement": coalesce(job.get("age")),
+        "publishedAt": _format_nuxt_date(job.get("created_at")),
+        "closingDate": _format_nuxt_date(job.get("closing_date")),
+        "jobDescription": _html_to_text(job.get("description")),
+        "jobRequirement": _html_to_text(job.get("requirement")),
+        "jobResponsibility": _html_to_text(job.get("responsible")),
+        "howToApply": NUXT_HOW_TO_APPLY,
+    }
+
+
+def _fetch_nuxt_detail(session, slug: str) -> Optional[Dict]:
+    """Read the job from the server-rendered Nuxt state; None if unavailable."""
+    try:
+        html = fetch_html(session, f"{BASE_URL}/jobs/{slug}")
+    except requests.RequestException as exc:
+        print(f"[WARN] Plain fetch failed for {slug}: {exc}")
+        return None
+    state = parse_nuxt_state(html)
+    job = _nuxt_job(state) if state else None
+    if not job:
+        return None
+    return _payload_from_nuxt(job, slug)
+
+
+def _setup_driver(headless: bool = True) -> webdriver.Chrome:
+    """Set up Chrome WebDriver for Selenium, recording network traffic."""
+    return create_driver(headless=headless, capture_network=True, profile="jobify")
+
+
+def _label_value(strong: Tag, label_text: str) -> str:
+    """Value that follows a label like 'Salary:' inside its parent element."""
+    # Get the parent element and extract all text, then remove the label
+    parent = strong.parent
+    if parent:
+        full_text = parent.get_text(strip=True)
+        value = full_text.replace(label_text, "", 1).strip()
+        if value:
+            return value
+    # Alternative: get next sibling text
+    next_elem = strong.next_sibling
+    if next_elem:
+        return str(next_elem).strip()
     return ""
 
 
-def _scrape_html_fallback(session, slug: str) -> Dict:
-    """Scrape job detail page using Selenium to handle JavaScript rendering."""
-    detail_url = f"{BASE_URL}/jobs/{slug}"
-    driver = _setup_driver(headless=True)
+def _index_page(soup: BeautifulSoup) -> Dict:
+    """Walk the page once, collecting every ``<strong>`` label and ``<h5>`` heading.
+
+    ``labels`` keeps (lowercased label, value, tag) in document order,
+    ``headings`` maps lowercased heading text to its first ``<h5>`` and
+    ``sections`` holds each heading's pre-collected text.
+    """
+    labels: List[Tuple[str, str, Tag]] = []
+    headings: Dict[str, Tag] = {}
+    for tag in soup.find_all(["strong", "h5"]):
+        text = tag.get_text(strip=True)
+        if tag.name == "h5":
+            headings.setdefault(text.lower(), tag)
+        else:
+            labels.append((text.lower(), _label_value(tag, text), tag))
+    return {"labels": labels, "headings": headings, "sections": _index_sections(headings)}
+
+
+def _section_lines(header: Tag) -> List[str]:
+    """Paragraphs and "• " bullets between an ``<h5>`` and the next one."""
+    # Get all content after this h5 until next h5
+    content_parts = []
+    current = header.find_next_sibling()
     
-    try:
-        driver.get(detail_url)
-        
-        # Wait for page to load
-        wait = WebDriverWait(driver, 15)
-        try:
-            # Wait for job title to appear
-            wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "h3"))
-            )
-        except TimeoutException:
-            pass
-        
-        # Give extra time for JavaScript to render
-        time.sleep(2)
-        
-        # Get rendered HTML
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # Extract title from h3 (main job title)
-        title_elem = soup.select_one("h3")
-        title_text = coalesce(title_elem.get_text(strip=True) if title_elem else "")
-        
-        # Extract fields using label-value pattern
-        salary = _extract_label_value(soup, "Salary:")
-        job_type = _extract_label_value(soup, "Job Type:")
-        job_level = _extract_label_value(soup, "Job Level:")
-        location = _extract_label_value(soup, "Location:")
-        industry = _extract_label_value(soup, "Industry:")
-        experience = _extract_label_value(soup, "Year of Experience:") or _extract_label_value(soup, "Experience:")
-        education = _extract_label_value(soup, "Qualification:")
-        # Extract language - it might be in a special format
-        language = _extract_label_value(soup, "Language:")
-        if not language:
-            # Try to find language in a flex column format
-            lang_elem = soup.find(lambda tag: "language" in tag.get_text(strip=True).lower()[:20])
-            if lang_elem:
-                # Get next sibling or parent text
-                parent = lang_elem.find_parent()
-                if parent:
-                    text = parent.get_text(strip=True)
-                    if "English" in text or "Khmer" in text:
-                        # Extract language info
-                        import re
-                        match = re.search(r'(English|Khmer|Chinese|Japanese|Korean)[\s—\-]+(Advanced|Intermediate|Basic|Native)', text, re.IGNORECASE)
-                        if match:
-                            language = f"{match.group(1)} - {match.group(2)}"
-        available_positions = _extract_label_value(soup, "Available Position:")
-        gender = _extract_label_value(soup, "Gender:")
-        age = _extract_label_value(soup, "Age:")
-        published_at = _extract_label_value(soup, "Published date:")
-        closing_at = _extract_label_value(soup, "Closing date:")
-        
-        # Extract skills
-        skills_text = _extract_label_value(soup, "Required Skills:")
-        skills_list = [s.strip() for s in skills_text.split(",") if s.strip()] if skills_text else []
-        
-        # Extract company name from __NUXT__ data or page
-        company = ""
-        # Try to extract from __NUXT__ script tag
-        scripts = soup.find_all("script")
-        for script in scripts:
-            if script.string and "company_name" in script.string:
-                import re
-                match = re.search(r'company_name["\']?\s*[:=]\s*["\']([^"\']+)["\']', script.string)
-                if match:
-                    company = match.group(1).strip()
-                    break
+    depth = 0
+    while current and depth < 30:
+        # Stop at next h5 (another section)
+        if current.name == "h5":
+            break
         
-        # If not found, try to find in page text
-        if not company:
-            # Look for company info in contact section or elsewhere
-            company_elem = soup.find(lambda tag: tag.name in ("div", "span", "p") 
-                                   and "company" in tag.get_text(strip=True).lower()[:30])
-            if company_elem:
-                text = company_elem.get_text(strip=True)
-                # Try to extract company name pattern
-                if ":" in text:
-                    parts = text.split(":", 1)
-                    if len(parts) > 1:
-                        company = parts[1].strip()[:100]
-        
-        # Helper function to collect description sections
-        def collect_section(label: str) -> str:
-            # Find h5 heading with the label
-            headers = soup.find_all("h5")
-            header = None
-            for h in headers:
-                text = h.get_text(strip=True).lower()
-                if label.lower() in text:
-                    header = h
-                    break
-            
-            if not header:
-                return ""
-            
-            # Find the parent container (usually has class "job-content")
-            parent_container = header.find_parent("div", class_=lambda x: x and "job-content" in str(x).lower())
-            if not parent_container:
-                parent_container = header.find_parent("div")
-            
-            # Get all content after this h5 until next h5
-            content_parts = []
-            current = header.find_next_sibling()
-            
-            depth = 0
-            while current and depth < 30:
-                # Stop at next h5 (another section)
-                if current.name == "h5":
-                    break
-                
-                # Get text from divs
-                if current.name == "div":
-                    classes = current.get("class", [])
-                    class_str = " ".join(classes) if classes else ""
-                    
-                    # Look for divs with class "text-dark" or content divs
-                    if "text-dark" in class_str or "content" in class_str.lower():
-                        # Get all content inside this div
-                        inner_divs = current.find_all("div", recursive=False)
-                        if inner_divs:
-                            for inner_div in inner_divs:
-                                # Get paragraphs and lists
-                                for elem in inner_div.find_all(["p", "ul", "ol"], recursive=False):
-                                    if elem.name == "p":
-                                        text = elem.get_text(strip=True)
-                                        if text and len(text) > 5:
-                                            content_parts.append(text)
-                                    elif elem.name in ("ul", "ol"):
-                                        items = [li.get_text(strip=True) for li in elem.find_all("li", recursive=False)]
-                                        content_parts.extend([f"• {item}" for item in items if item])
-                        else:
-                            # Direct content in div
-                            for elem in current.find_all(["p", "ul", "ol"], recursive=False):
-                                if elem.name == "p":
-                                    text = elem.get_text(strip=True)
-                                    if text and len(text) > 5:
-                                        content_parts.append(text)
-                                elif elem.name in ("ul", "ol"):
-                                    items = [li.get_text(strip=True) for li in elem.find_all("li", recursive=False)]
-                                    content_parts.extend([f"• {item}" for item in items if item])
-                elif current.name in ("ul", "ol"):
-                    items = [li.get_text(strip=True) for li in current.find_all("li", recursive=False)]
-                    content_parts.extend([f"• {item}" for item in items if item])
-                elif current.name == "p":
-                    text = current.get_text(strip=True)
-                    if text and len(text) > 5:
-                        content_parts.append(text)
-                
-                current = current.find_next_sibling()
-                depth += 1
+        # Get text from divs
+        if current.name == "div":
+            classes = current.get("class", [])
+            class_str = " ".join(classes) if classes else ""
             
-            # Clean up content
-            cleaned = []
-            for part in content_parts:
-                part = part.strip()
-                if part and len(part) > 3:
-                    cleaned.append(part)
-            
-            return "\n".join(cleaned) if cleaned else ""
-        
-        description = collect_section("Job Description") or collect_section("Description")
-        requirements = collect_section("Job Requirement") or collect_section("Requirement") or collect_section("Requirements")
-        responsibilities = collect_section("Job Responsibility") or collect_section("Responsibility") or collect_section("Responsibilities")
-        
-        # Special handling for "How to apply" - it might be formatted differently
-        how_to_apply = ""
-        apply_headers = soup.find_all("h5")
-        for h in apply_headers:
-            text = h.get_text(strip=True).lower()
-            if "how to apply" in text or "apply" in text:
-                # Get the next div with class "text-dark"
-                next_div = h.find_next_sibling("div")
-                if next_div:
-                    # Get all text content
-                    apply_text = next_div.get_text(separator="\n", strip=True)
-                    if apply_text:
-                        how_to_apply = apply_text
-                        break
-                # If not found, try parent's next sibling
-                parent = h.find_parent("div")
-                if parent:
-                    next_sibling = parent.find_next_sibling("div")
-                    if next_sibling:
-                        apply_text = next_sibling.get_text(separator="\n", strip=True)
-                        if apply_text:
-                            how_to_apply = apply_text
-                            break
+            # Look for divs with class "text-dark" or content divs
+            if "text-dark" in class_str or "content" in class_str.lower():
+                # Get all content inside this div
+                inner_divs = current.find_all("div", recursive=False)
+                if inner_divs:
+                    for inner_div in inner_divs:
+                        # Get paragraphs and lists
+                        for elem in inner_div.find_all(["p", "ul", "ol"], recursive=False):
+                            if elem.name == "p":
+                                text = elem.get_text(strip=True)
+                                if text and len(text) > 5:
+                                    content_parts.append(text)
+                            elif elem.name in ("ul", "ol"):
+                                items = [li.get_text(strip=True) for li in elem.find_all("li", recursive=False)]
+                                content_parts.extend([f"• {item}" for item in items if item])
+                else:
+                    # Direct content in div
+                    for elem in current.find_all(["p", "ul", "ol"], recursive=False):
+                        if elem.name == "p":
+                            text = elem.get_text(strip=True)
+                            if text and len(text) > 5:
+                                content_parts.append(text)
+                        elif elem.name in ("ul", "ol"):
+                            items = [li.get_text(strip=True) for li in elem.find_all("li", recursive=False)]
+                            content_parts.extend([f"• {item}" for item in items if item])
+        elif current.name in ("ul", "ol"):
+            items = [li.get_text(strip=True) for li in current.find_all("li", recursive=False)]
+            content_parts.extend([f"• {item}" for item in items if item])
+        elif current.name == "p":
+            text = current.get_text(strip=True)
+            if text and len(text) > 5:
+                content_parts.append(text)
         
-        # Fallback to collect_section if not found
-        if not how_to_apply:
-            how_to_apply = collect_section("How to apply") or collect_section("How to Apply") or collect_section("Apply")
-        
-        return {
-            "id": slug,
-            "slug": slug,
-            "title": title_text,
-            "company": {"name": company} if company else {},
-            "salary": salary,
-            "jobType": job_type,
-            "jobLevel": job_level,
-            "location": location,
-            "industry": industry,
-            "experienceYears": experience,
-            "qualification": education,
-            "language": language,
-            "numberOfPositions": available_positions,
-            "skills": skills_list,
-            "genderRequirement": gender,
-            "ageRequirement": age,
-            "publishedAt": published_at,
-            "closingDate": closing_at,
-            "jobDescription": description,
-            "jobRequirement": requirements,
-            "jobResponsibility": responsibilities,
-            "howToApply": how_to_apply,
+        current = current.find_next_sibling()
+        depth += 1
+    
+    # Clean up content
+    cleaned = []
+    for part in content_parts:
+        part = part.strip()
+        if part and len(part) > 3:
+            cleaned.append(part)
+    return cleaned
+
+
+def _sibling_div_text(tag: Optional[Tag]) -> str:
+    """Text of the first ``<div>`` following ``tag`` at the same level."""
+    if tag is None:
+        return ""
+    next_div = tag.find_next_sibling("div")
+    return next_div.get_text(separator="\n", strip=True) if next_div else ""
+
+
+def _index_sections(headings: Dict[str, Tag]) -> Dict[str, Dict]:
+    """Split the page into heading-keyed blocks, each walked exactly once."""
+    return {
+        text: {
+            "text": "\n".join(_section_lines(header)),
+            # "How to apply" is a bare text div rather than paragraphs/bullets
+            "next_div_text": _sibling_div_text(header),
+            "parent_next_div_text": _sibling_div_text(header.find_parent("div")),
         }
-        
-    finally:
-        driver.quit()
+        for text, header in headings.items()
+    }
+
+
+def _section_text(index: Dict, *aliases: str) -> str:
+    """Text of the first section matching an alias: exact heading, then substring."""
+    sections = index["sections"]
+    for alias in aliases:
+        wanted = alias.lower()
+        section = sections.get(wanted)
+        if section is None:
+            section = next((s for text, s in sections.items() if wanted in text), None)
+        if section and section["text"]:
+            return section["text"]
+    return ""
+
+
+def _lookup_label(index: Dict, *labels: str) -> str:
+    """First non-empty value whose label contains one of ``labels``, tried in order."""
+    for label in labels:
+        wanted = label.lower()
+        for key, value, _ in index["labels"]:
+            if wanted in key and value:
+                return value
+    return ""
+
+
+def _label_row_text(strong: Tag) -> str:
+    """Text of the smallest ancestor holding more than the label itself."""
+    label_text = strong.get_text(strip=True)
+    row = strong.parent
+    while row is not None and row.get_text(strip=True) == label_text:
+        row = row.parent
+    return row.get_text(strip=True) if row is not None else ""
 
 
-def fetch_job_detail(session, build_id: str, job_row: Dict) -> Dict:
+def create_driver_pool(size: int = 1, max_pages: int = 50) -> DriverPool:
+    """Pool of headless drivers reused across detail pages."""
+    return DriverPool(lambda: _setup_driver(headless=True), size=size, max_pages=max_pages)
+
+
+def _is_job_record(slug: str):
+    """Predicate for the API record of job ``slug``."""
+    def matches(record: Dict) -> bool:
+        return bool(record.get("job_title")) and slug in (str(record.get("id")), record.get("slug"))
+    return matches
+
+
+def _report_traffic(meter: TrafficMeter, detail_url: str) -> None:
+    # Each page gets its own meter, so its summary is the page's traffic
+    meter.record(pages=1)
+    if meter.enabled:
+        print(f"[INFO] {detail_url}: {meter.summary()}")
+
+
+def _render_detail_page(driver: webdriver.Chrome, detail_url: str, slug: str) -> Tuple[str, Optional[Dict]]:
+    """Navigate to a detail page; return the rendered HTML or the job's API record.
+
+    A client-side navigation loads the job as JSON, which is used as soon as
+    it arrives. A server-rendered page makes no such request, so the capture
+    gives up once the title is on screen and the HTML is used instead.
+    """
+    capture = NetworkCapture(driver)
+    capture.discard()  # drop the previous page's traffic
+    capture.take_traffic()
+    meter = TrafficMeter(driver, capture, name="jobify-detail")
+    driver.get(detail_url)
+
+    record = capture.wait_for_record(
+        _is_job_record(slug),
+        timeout=10,
+        stop=lambda: bool(driver.find_elements(By.CSS_SELECTOR, "h3")),
+    )
+    if record is not None:
+        _report_traffic(meter, detail_url)
+        return "", record
+
+    # Wait for page to load
+    wait = WebDriverWait(driver, 15)
+    try:
+        # Wait for job title to appear
+        wait.until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "h3"))
+        )
+    except TimeoutException:
+        pass
+
+    # Give extra time for JavaScript to render
+    time.sleep(2)
+    _report_traffic(meter, detail_url)
+    return driver.page_source, None
+
+
+def _scrape_html_fallback(session, slug: str, pool: Optional[DriverPool] = None) -> Dict:
+    """Scrape job detail page using Selenium to handle JavaScript rendering.
+
+    With a ``pool`` the page is rendered on a leased warm driver; otherwise a
+    throwaway driver is started and quit for this job alone.
+    """
+    detail_url = f"{BASE_URL}/jobs/{slug}"
+    if pool is not None:
+        with pool.lease() as driver:
+            html, record = _render_detail_page(driver, detail_url, slug)
+    else:
+        driver = _setup_driver(headless=True)
+        try:
+            html, record = _render_detail_page(driver, detail_url, slug)
+        finally:
+            driver.quit()
+
+    if record is not None:
+        return _payload_from_nuxt(record, slug)
+
+    soup = BeautifulSoup(html, "html.parser")
+    return _parse_detail_html(soup, slug)
+
+
+def _parse_detail_html(soup: BeautifulSoup, slug: str) -> Dict:
+    """Turn a rendered detail page into the payload shape `_flatten_detail` expects."""
+    # Extract title from h3 (main job title)
+    title_elem = soup.select_one("h3")
+    title_text = coalesce(title_elem.get_text(strip=True) if title_elem else "")
+    
+    # Extract fields using label-value pattern, all from one pass over the page
+    index = _index_page(soup)
+    salary = _lookup_label(index, "Salary:")
+    job_type = _lookup_label(index, "Job Type:")
+    job_level = _lookup_label(index, "Job Level:")
+    location = _lookup_label(index, "Location:")
+    industry = _lookup_label(index, "Industry:")
+    experience = _lookup_label(index, "Year of Experience:", "Experience:")
+    education = _lookup_label(index, "Qualification:")
+    # Extract language - it might be in a special format
+    language = _lookup_label(index, "Language:")
+    if not language:
+        # Language values sit in a flex column next to the label, not in its parent
+        for key, _, strong in index["labels"]:
+            if "language" not in key:
+                continue
+            text = _label_row_text(strong)
+            if "English" in text or "Khmer" in text:
+                match = LANGUAGE_RE.search(text)
+                if match:
+                    language = f"{match.group(1)} - {match.group(2)}"
+                    break
+    available_positions = _lookup_label(index, "Available Position:")
+    gender = _lookup_label(index, "Gender:")
+    age = _lookup_label(index, "Age:")
+    published_at = _lookup_label(index, "Published date:")
+    closing_at = _lookup_label(index, "Closing date:")
+    
+    # Extract skills
+    skills_text = _lookup_label(index, "Required Skills:")
+    skills_list = [s.strip() for s in skills_text.split(",") if s.strip()] if skills_text else []
+    
+    # Extract company name from __NUXT__ data or page
+    company = ""
+    # Try to extract from __NUXT__ script tag
+    scripts = soup.find_all("script")
+    for script in scripts:
+        if script.string and "company_name" in script.string:
+            match = re.search(r'company_name["\']?\s*[:=]\s*["\']([^"\']+)["\']', script.string)
+            if match:
+                company = match.group(1).strip()
+                break
+    
+    # If not found, try a "Company:" label on the page
+    if not company:
+        company = _lookup_label(index, "company")[:100]
+    
+    description = _section_text(index, "Job Description", "Description")
+    requirements = _section_text(index, "Job Requirement", "Requirement", "Requirements")
+    responsibilities = _section_text(index, "Job Responsibility", "Responsibility", "Responsibilities")
+    
+    # Special handling for "How to apply" - it might be formatted differently
+    how_to_apply = ""
+    for text, section in index["sections"].items():
+        if "apply" in text:
+            how_to_apply = section["next_div_text"] or section["parent_next_div_text"]
+            if how_to_apply:
+                break
+    
+    # Fallback to the section's paragraphs if not found
+    if not how_to_apply:
+        how_to_apply = _section_text(index, "How to apply", "Apply")
+    
+    return {
+        "id": slug,
+        "slug": slug,
+        "title": title_text,
+        "company": {"name": company} if company else {},
+        "salary": salary,
+        "jobType": job_type,
+        "jobLevel": job_level,
+        "location": location,
+        "industry": industry,
+        "experienceYears": experience,
+        "qualification": education,
+        "language": language,
+        "numberOfPositions": available_positions,
+        "skills": skills_list,
+        "genderRequirement": gender,
+        "ageRequirement": age,
+        "publishedAt": published_at,
+        "closingDate": closing_at,
+        "jobDescription": description,
+        "jobRequirement": requirements,
+        "jobResponsibility": responsibilities,
+        "howToApply": how_to_apply,
+    }
+
+
+def fetch_job_detail(session, build_id: str, job_row: Dict, pool: Optional[DriverPool] = None) -> Dict:
     """
     Fetch job detail from Jobify.
-    Since this is a Nuxt.js app (not Next.js), we skip the API call and use HTML scraping.
+    Since this is a Nuxt.js app (not Next.js), the server-rendered ``__NUXT__``
+    state is read over plain HTTP first; Selenium is only used when that fails.
+    Pass a ``pool`` from `create_driver_pool` to reuse browsers between jobs.
     """
     slug = job_row["slug"]
-    
-    # Try HTML scraping directly (Nuxt.js doesn't use /_next/data/ endpoints)
-    # If build_id is provided and not empty, we could try API, but for now use HTML
-    job_payload = _scrape_html_fallback(session, slug)
+
+    # Nuxt.js doesn't use /_next/data/ endpoints, but it embeds the job in the page
+    job_payload = _fetch_nuxt_detail(session, slug) if session is not None else None
+    if job_payload is None:
+        if replay_enabled():
+            raise CacheMiss(f"No cached page for {slug} (replay mode)")
+        job_payload = _scrape_html_fallback(session, slug, pool)
 
     detail = _flatten_detail(job_payload, job_row["url"])
     # Ensure any empty-ish values stay blank, not whitespace
@@ -0,0 +1,102 @@
+# Jobify/driver_pool.py
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+
+class DriverPool:
+    """Bounded pool of warm Chrome drivers leased out one job at a time.
+
+    Drivers are started lazily, handed back after each job and recycled once
+    they have rendered ``max_pages`` pages or raised a WebDriver error.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], webdriver.Chrome],
+        size: int = 1,
+        max_pages: int = 50,
+    ) -> None:
+        self._factory = factory
+        self._max_pages = max_pages
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: "queue.LifoQueue[webdriver.Chrome]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._pages: Dict[int, int] = {}
+        self._live: List[webdriver.Chrome] = []
+        self._closed = False
+
+    def _checkout(self) -> webdriver.Chrome:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        driver = self._factory()
+        with self._lock:
+            self._live.append(driver)
+            self._pages[id(driver)] = 0
+        return driver
+
+    def _retire(self, driver: webdriver.Chrome) -> None:
+        with self._lock:
+            self._pages.pop(id(driver), None)
+            if driver in self._live:
+                self._live.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _checkin(self, driver: webdriver.Chrome) -> None:
+        with self._lock:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+            worn_out = self._pages[id(driver)] >= self._max_pages
+        if worn_out or self._closed:
+            self._retire(driver)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def lease(self) -> Iterator[webdriver.Chrome]:
+        """Borrow a driver; it is recycled instead of returned if it crashed."""
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        self._slots.acquire()
+        try:
+            driver = self._checkout()
+            try:
+                yield driver
+            except TimeoutException:
+                self._checkin(driver)
+                raise
+            except WebDriverException:
+                print("[WARN] Driver crashed; recycling it")
+                self._retire(driver)
+                raise
+            except BaseException:
+                self._checkin(driver)
+                raise
+            else:
+                self._checkin(driver)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Quit every driver the pool has started."""
+        self._closed = True
+        with self._lock:
+            drivers = list(self._live)
+        for driver in drivers:
+            self._retire(driver)
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
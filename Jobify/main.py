@@ -1,21 +1,40 @@
 # Jobify/main.py
+import argparse
+import asyncio
 import csv
 import re
+import sys
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
 
+import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
-from detail import DETAIL_FIELDS, fetch_job_detail
-from utils import BASE_URL, coalesce, make_session, polite_sleep
+# Make the repo-level ``common`` package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.cli import add_common_args, apply_common_args
+from common.csv_sink import CsvSink
+from common.driver_factory import create_driver
+from common.http_cache import replay_enabled
+from common.lean_profile import TrafficMeter
+from common.rate_limit import HostRateLimiter
+from common.scraper import Scraper
+from common.seen_store import Watermark
+
+from detail import DETAIL_FIELDS, create_driver_pool, fetch_job_detail
+from nuxt import parse_nuxt_state
+from utils import BASE_URL, coalesce, fetch_html, make_session
+
+LIST_CSV = "jobify_jobs_list.csv"
+DETAIL_CSV = "jobify_jobs_detail.csv"
 
 LIST_FIELDS = [
     "job_id",
@@ -30,33 +49,261 @@ LIST_FIELDS = [
     "skills",
 ]
 
+# Detail pages rendered by one Chrome instance before it is restarted
+DRIVER_MAX_PAGES = 50
+
+# Detail fetches kept in flight, and the politeness budget per host
+DETAIL_CONCURRENCY = 3
+DETAIL_REQUESTS_PER_SECOND = 1.0
+
+# Listing pages addressed directly instead of clicking through the paginator
+LIST_PAGE_URL = f"{BASE_URL}/jobs?page={{page}}"
+LIST_WORKERS = 4
+TARGET_JOBS = 2000
+
 
 def _setup_driver(headless: bool = True) -> webdriver.Chrome:
     """Set up Chrome WebDriver for Selenium."""
-    options = Options()
-    options.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    return create_driver(headless=headless, profile="jobify")
+
+
+# Returns job anchors not reported by an earlier call. Each anchor is tagged
+# with the href it was reported under, so nodes Vue patches in place when the
+# paginator swaps pages are picked up again. Only card HTML crosses the wire.
+_HARVEST_JS = """
+var out = [];
+var anchors = document.querySelectorAll("a[href*='/jobs/']");
+for (var i = 0; i < anchors.length; i++) {
+    var a = anchors[i];
+    var href = a.getAttribute('href');
+    if (a.getAttribute('data-harvested') === href) continue;
+    a.setAttribute('data-harvested', href);
+    var card = a.parentElement ? a.parentElement.closest('div, article, section') : null;
+    out.push({href: href, html: (card || a).outerHTML});
+}
+return out;
+"""
+
+# Cheap probe: how many job anchors appeared since the last harvest
+_PENDING_COUNT_JS = """
+var n = 0;
+var anchors = document.querySelectorAll("a[href*='/jobs/']");
+for (var i = 0; i < anchors.length; i++) {
+    if (anchors[i].getAttribute('data-harvested') !== anchors[i].getAttribute('href')) n++;
+}
+return n;
+"""
+
+
+def _job_slug(href: str) -> str:
+    """Numeric job id from hrefs like /jobs/1234, or "" for anything else."""
+    if not href or href in ["/jobs", "/jobs/"] or "/jobs/" not in href:
+        return ""
+    slug = href.split("/jobs/")[-1].strip("/").split("?")[0]
+    return slug if slug.isdigit() else ""
+
+
+def _row_from_anchor(a) -> Dict:
+    """Build a LIST_FIELDS row from a job anchor and its surrounding card."""
+    href = a.get("href")
+    slug = _job_slug(href)
+
+    # Normalize href (might be relative or absolute)
+    if href.startswith("/"):
+        full_url = BASE_URL + href
+    elif href.startswith("http"):
+        full_url = href
+    else:
+        full_url = f"{BASE_URL}/jobs/{href}"
+
+    # Get title from link text or nearby elements
+    title = coalesce(a.get_text(strip=True))
+    if not title or len(title) < 5:
+        # Try to find title in parent or sibling elements
+        parent = a.find_parent()
+        if parent:
+            title_elem = parent.find(["h1", "h2", "h3", "h4", "h5", ".title", "[class*='title']"])
+            if title_elem:
+                title = coalesce(title_elem.get_text(strip=True))
+    
+    # Try to extract additional info from the job card if available
+    job_card = a.find_parent(["div", "article", "section"])
+    company = ""
+    location = ""
+    salary = ""
+    job_type = ""
+    posted_at = ""
+    skills = ""
+    
+    if job_card:
+        # Try to find company name
+        company_elem = job_card.find(["div", "span"], class_=lambda x: x and "company" in str(x).lower())
+        if company_elem:
+            company = coalesce(company_elem.get_text(strip=True))
+        
+        # Try to find location
+        location_elem = job_card.find(["div", "span"], class_=lambda x: x and "location" in str(x).lower())
+        if location_elem:
+            location = coalesce(location_elem.get_text(strip=True))
+        
+        # Try to find salary
+        salary_elem = job_card.find(["div", "span"], class_=lambda x: x and "salary" in str(x).lower())
+        if salary_elem:
+            salary = coalesce(salary_elem.get_text(strip=True))
+        
+        # Try to find job type
+        type_elem = job_card.find(["div", "span"], class_=lambda x: x and ("type" in str(x).lower() or "full" in str(x).lower() or "part" in str(x).lower()))
+        if type_elem:
+            job_type = coalesce(type_elem.get_text(strip=True))
+
+    return {
+        "job_id": slug,
+        "slug": slug,
+        "title": title or "N/A",
+        "company": company,
+        "location": location,
+        "salary": salary,
+        "job_type": job_type,
+        "posted_at": posted_at,
+        "url": full_url,
+        "skills": skills,
+    }
+
+
+def _harvest_new_jobs(driver: webdriver.Chrome, jobs: List[Dict], seen: set) -> int:
+    """Append rows for job cards rendered since the last call; returns how many."""
+    added = 0
+    for record in driver.execute_script(_HARVEST_JS) or []:
+        slug = _job_slug(record.get("href") or "")
+        if not slug or slug in seen:
+            continue
+        card = BeautifulSoup(record["html"], "html.parser")
+        anchor = card.find("a", href=record["href"])
+        if anchor is None:
+            continue
+        seen.add(slug)
+        jobs.append(_row_from_anchor(anchor))
+        added += 1
+    return added
+
+
+def _row_from_record(record: Dict) -> Dict:
+    """Build a LIST_FIELDS row from a job record in the Nuxt store."""
+    slug = str(record.get("id") or "")
+    salary = coalesce(record.get("salary"))
+    if not salary and record.get("min_salary") is not None:
+        salary = f"${record['min_salary']} ~ ${record.get('max_salary')}"
+    location = ", ".join(
+        coalesce(record.get(key)) for key in ("district", "city_province") if coalesce(record.get(key))
     )
-    if headless:
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--start-maximized")
-
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.execute_script(
-        "Object.defineProperty(navigator, 'webdriver', {get: () => false});"
+    skills = ", ".join(
+        coalesce(item.get("skill")) for item in record.get("skills") or []
+        if isinstance(item, dict) and item.get("skill")
     )
-    return driver
+    return {
+        "job_id": slug,
+        "slug": slug,
+        "title": coalesce(record.get("job_title")) or "N/A",
+        "company": coalesce(record.get("company_name")),
+        "location": location,
+        "salary": salary,
+        "job_type": coalesce(record.get("job_type")),
+        "posted_at": coalesce(record.get("created_at")),
+        "url": f"{BASE_URL}/jobs/{slug}",
+        "skills": skills,
+    }
+
+
+def _parse_list_page(html: str) -> Dict:
+    """Rows and page count from one server-rendered listing page.
+
+    Prefers the job list the Nuxt store was hydrated with; falls back to
+    the rendered job anchors and the Vuetify paginator buttons.
+    """
+    rows: List[Dict] = []
+    last_page = 1
+    state = parse_nuxt_state(html) or {}
+    listing = ((state.get("state") or {}).get("job_post") or {}).get("allJobPostsFilter")
+    if isinstance(listing, dict) and isinstance(listing.get("data"), list):
+        rows = [_row_from_record(r) for r in listing["data"] if isinstance(r, dict) and r.get("id")]
+        pagination = listing.get("pagination")
+        last_page = int((pagination if isinstance(pagination, dict) else {}).get("lastPage") or 1)
+    if not rows:
+        soup = BeautifulSoup(html, "html.parser")
+        seen = set()
+        for a in soup.select("a[href*='/jobs/']"):
+            slug = _job_slug(a.get("href") or "")
+            if slug and slug not in seen:
+                seen.add(slug)
+                rows.append(_row_from_anchor(a))
+        for button in soup.select("button.v-pagination__item"):
+            match = re.search(r"(\d+)\s*$", button.get("aria-label") or button.get_text(strip=True))
+            if match:
+                last_page = max(last_page, int(match.group(1)))
+    return {"rows": rows, "last_page": last_page}
+
+
+def _fetch_list_page(session, page: int) -> Optional[Dict]:
+    try:
+        return _parse_list_page(fetch_html(session, LIST_PAGE_URL.format(page=page)))
+    except requests.RequestException as exc:
+        print(f"[WARN] Listing page {page} failed: {exc}")
+        return None
+    except (ValueError, TypeError) as exc:  # e.g. a non-numeric lastPage in the Nuxt state
+        print(f"[WARN] Listing page {page} has an unexpected payload: {exc}")
+        return None
+
+
+def _scrape_jobs_http(session, max_workers: int = LIST_WORKERS, target_jobs: int = TARGET_JOBS) -> List[Dict]:
+    """Fetch listing pages over plain HTTP, several at a time.
+
+    Returns an empty list when the server-rendered pages don't carry jobs or
+    ignore ``?page=``, so the caller can fall back to the browser.
+    """
+    first = _fetch_list_page(session, 1)
+    if not first or not first["rows"]:
+        print("[INFO] Job list is not server-rendered; using browser pagination")
+        return []
+    last_page = first["last_page"]
+    print(f"[INFO] HTTP listing: {last_page} page(s) behind the paginator")
+
+    pages = {1: first}
+    if last_page > 1:
+        second = _fetch_list_page(session, 2)
+        first_slugs = {row["slug"] for row in first["rows"]}
+        if not second or not {row["slug"] for row in second["rows"]} - first_slugs:
+            print("[INFO] Server ignores ?page=; using browser pagination")
+            return []
+        pages[2] = second
+        # Estimate how many pages the target needs so we don't fetch the whole archive
+        wanted = min(last_page, -(-target_jobs // max(len(first["rows"]), 1)))
+        todo = list(range(3, wanted + 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages.update(zip(todo, executor.map(lambda page: _fetch_list_page(session, page), todo)))
+            failed = [page for page in todo if pages[page] is None]
+            if failed:
+                print(f"[INFO] Retrying {len(failed)} failed listing page(s): {failed}")
+                pages.update(zip(failed, executor.map(lambda page: _fetch_list_page(session, page), failed)))
+                failed = [page for page in failed if pages[page] is None]
+        if failed:
+            # The browser only clicks through the paginator, so it can't fill single pages in
+            print(f"[WARN] {len(failed)} of {wanted} listing page(s) failed twice; their jobs are missing: {failed}")
+
+    jobs: List[Dict] = []
+    seen = set()
+    for _, page in sorted(pages.items()):
+        for row in (page or {}).get("rows", []):
+            if row["slug"] not in seen and len(jobs) < target_jobs:
+                seen.add(row["slug"])
+                jobs.append(row)
+    print(f"[INFO] Extracted {len(jobs)} unique jobs over HTTP")
+    return jobs
 
 
 def _scrape_jobs_page(session) -> List[Dict]:
     """Scrape job listings from Jobify using Selenium to handle JavaScript rendering."""
     driver = _setup_driver(headless=True)
+    meter = TrafficMeter(driver, name="jobify-list")
     jobs: List[Dict] = []
     seen = set()
 
@@ -83,7 +330,7 @@ def _scrape_jobs_page(session) -> List[Dict]:
         time.sleep(3)
         
         # Target: Get 200 jobs
-        target_jobs = 2000
+        target_jobs = TARGET_JOBS
         max_attempts = 100  # Maximum attempts to load more jobs (increased for pagination)
         attempt = 0
         current_page = 1
@@ -93,24 +340,11 @@ def _scrape_jobs_page(session) -> List[Dict]:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(2)
             
-            # Count current jobs
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            anchors = soup.select("a[href*='/jobs/']")
-            if not anchors:
-                anchors = soup.find_all("a", href=True)
-                anchors = [a for a in anchors if "/jobs/" in a.get("href", "")]
-            
-            # Filter out navigation links
-            job_links = []
-            for a in anchors:
-                href = a.get("href", "")
-                if href and "/jobs/" in href and href not in ["/jobs", "/jobs/"]:
-                    slug = href.split("/jobs/")[-1].strip("/").split("?")[0]
-                    if slug and slug.isdigit():  # Only numeric slugs (job IDs)
-                        job_links.append(slug)
-            
-            unique_jobs = len(set(job_links))
-            print(f"[INFO] Attempt {attempt + 1}: Found {unique_jobs} unique jobs")
+            # Collect only the cards added since the previous attempt
+            added = _harvest_new_jobs(driver, jobs, seen)
+            unique_jobs = len(jobs)
+            print(f"[INFO] Attempt {attempt + 1}: Found {unique_jobs} unique jobs (+{added})")
+            meter.page(f"Attempt {attempt + 1}")  # also keeps the performance log from piling up
             
             if unique_jobs >= target_jobs:
                 print(f"[INFO] Reached target of {target_jobs} jobs!")
@@ -203,143 +437,36 @@ def _scrape_jobs_page(session) -> List[Dict]:
                         break
                     last_height = new_height
             
-            # Check if we got new jobs
+            # Check if we got new jobs without pulling the page source
             time.sleep(2)
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            new_anchors = soup.select("a[href*='/jobs/']")
-            if not new_anchors:
-                new_anchors = soup.find_all("a", href=True)
-                new_anchors = [a for a in new_anchors if "/jobs/" in a.get("href", "")]
-            
-            new_job_links = []
-            for a in new_anchors:
-                href = a.get("href", "")
-                if href and "/jobs/" in href and href not in ["/jobs", "/jobs/"]:
-                    slug = href.split("/jobs/")[-1].strip("/").split("?")[0]
-                    if slug and slug.isdigit():
-                        new_job_links.append(slug)
-            
-            new_unique = len(set(new_job_links))
-            if new_unique == unique_jobs and not load_more_clicked:
+            pending = driver.execute_script(_PENDING_COUNT_JS)
+            if not pending and not load_more_clicked:
                 # Check if we're on the last page
                 try:
                     next_btn = driver.find_element(By.CSS_SELECTOR, "button.v-pagination__navigation:not([disabled])")
                     if not next_btn or "disabled" in next_btn.get_attribute("class"):
-                        print(f"[INFO] Reached last page. Total jobs: {new_unique}")
+                        print(f"[INFO] Reached last page. Total jobs: {unique_jobs}")
                         break
                 except:
-                    print(f"[INFO] No more pages available. Total jobs: {new_unique}")
+                    print(f"[INFO] No more pages available. Total jobs: {unique_jobs}")
                     break
             else:
                 if load_more_clicked:
                     current_page += 1
-                    print(f"[INFO] Now on page {current_page}, total unique jobs: {new_unique}")
+                    print(f"[INFO] Now on page {current_page}, {pending} new job links to collect")
             
-            unique_jobs = new_unique
             attempt += 1
         
         # Scroll back to top
         driver.execute_script("window.scrollTo(0, 0);")
         time.sleep(1)
         
-        # Get final rendered HTML
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # Find all job links
-        anchors = soup.select("a[href*='/jobs/']")
-        if not anchors:
-            anchors = soup.find_all("a", href=True)
-            anchors = [a for a in anchors if "/jobs/" in a.get("href", "")]
-        
-        print(f"[INFO] Final count: Found {len(anchors)} potential job links")
-        
-        for a in anchors:
-            href = a.get("href")
-            if not href:
-                continue
-            
-            # Skip navigation links
-            if href in ["/jobs", "/jobs/"]:
-                continue
-            
-            # Normalize href (might be relative or absolute)
-            if href.startswith("/"):
-                full_url = BASE_URL + href
-            elif href.startswith("http"):
-                full_url = href
-            else:
-                full_url = f"{BASE_URL}/jobs/{href}"
-            
-            # Extract slug from href like /jobs/1234 or /jobs/slug-name
-            if "/jobs/" in href:
-                slug = href.split("/jobs/")[-1].strip("/").split("?")[0]
-            else:
-                continue
-            
-            # Only process numeric job IDs (skip if slug is not a number)
-            if not slug or not slug.isdigit():
-                continue
-            
-            if slug in seen:
-                continue
-            seen.add(slug)
-            
-            # Get title from link text or nearby elements
-            title = coalesce(a.get_text(strip=True))
-            if not title or len(title) < 5:
-                # Try to find title in parent or sibling elements
-                parent = a.find_parent()
-                if parent:
-                    title_elem = parent.find(["h1", "h2", "h3", "h4", "h5", ".title", "[class*='title']"])
-                    if title_elem:
-                        title = coalesce(title_elem.get_text(strip=True))
-            
-            # Try to extract additional info from the job card if available
-            job_card = a.find_parent(["div", "article", "section"])
-            company = ""
-            location = ""
-            salary = ""
-            job_type = ""
-            posted_at = ""
-            skills = ""
-            
-            if job_card:
-                # Try to find company name
-                company_elem = job_card.find(["div", "span"], class_=lambda x: x and "company" in str(x).lower())
-                if company_elem:
-                    company = coalesce(company_elem.get_text(strip=True))
-                
-                # Try to find location
-                location_elem = job_card.find(["div", "span"], class_=lambda x: x and "location" in str(x).lower())
-                if location_elem:
-                    location = coalesce(location_elem.get_text(strip=True))
-                
-                # Try to find salary
-                salary_elem = job_card.find(["div", "span"], class_=lambda x: x and "salary" in str(x).lower())
-                if salary_elem:
-                    salary = coalesce(salary_elem.get_text(strip=True))
-                
-                # Try to find job type
-                type_elem = job_card.find(["div", "span"], class_=lambda x: x and ("type" in str(x).lower() or "full" in str(x).lower() or "part" in str(x).lower()))
-                if type_elem:
-                    job_type = coalesce(type_elem.get_text(strip=True))
-            
-            jobs.append(
-                {
-                    "job_id": slug,
-                    "slug": slug,
-                    "title": title or "N/A",
-                    "company": company,
-                    "location": location,
-                    "salary": salary,
-                    "job_type": job_type,
-                    "posted_at": posted_at,
-                    "url": full_url,
-                    "skills": skills,
-                }
-            )
+        # Pick up anything rendered after the last attempt
+        _harvest_new_jobs(driver, jobs, seen)
         
         print(f"[INFO] Extracted {len(jobs)} unique jobs")
+        if meter.enabled:
+            print(f"[INFO] Traffic: {meter.summary()}")
         
     finally:
         driver.quit()
@@ -358,28 +485,108 @@ def _save_csv(rows: List[Dict], path: str, fieldnames: List[str]) -> None:
     print(f"[OK] Wrote {len(rows)} rows -> {path}")
 
 
-def main() -> None:
-    session = make_session()
-    listings = _scrape_jobs_page(session)
-    _save_csv(listings, "jobify_jobs_list.csv", LIST_FIELDS)
+async def _fetch_details(
+    session,
+    listings: List[Dict],
+    sink: CsvSink,
+    concurrency: int = DETAIL_CONCURRENCY,
+    requests_per_second: float = DETAIL_REQUESTS_PER_SECOND,
+) -> int:
+    """Fetch details with several jobs in flight, rate limited per host.
 
-    if not listings:
-        print("[INFO] No listings found; skipping detail scrape.")
-        return
+    Blocking fetches run on a thread per slot. Rows reach ``sink`` in
+    listing order: each finished row is held until every listing before it
+    has finished, then the completed prefix is written. Returns how many
+    rows were written.
+    """
+    limiter = HostRateLimiter(requests_per_second)
+    semaphore = asyncio.Semaphore(concurrency)
+    pool = create_driver_pool(size=concurrency, max_pages=DRIVER_MAX_PAGES)
+    loop = asyncio.get_running_loop()
+    total = len(listings)
+    # Per listing: None while in flight, then the row or {} for a failure
+    finished: List[Optional[Dict]] = [None] * total
+    next_to_write = 0
+
+    def flush_prefix() -> None:
+        nonlocal next_to_write
+        while next_to_write < total and finished[next_to_write] is not None:
+            if finished[next_to_write]:
+                sink.write(finished[next_to_write])
+            finished[next_to_write] = {}  # release the row once written
+            next_to_write += 1
 
-    detailed_rows: List[Dict] = []
-    for idx, job in enumerate(listings, 1):
+    async def fetch_one(idx: int, job: Dict, executor: ThreadPoolExecutor) -> bool:
+        async with semaphore:
+            await limiter.acquire_async(job["url"])
+            try:
+                detail = await loop.run_in_executor(
+                    executor, fetch_job_detail, session, "", job, pool  # no build_id needed
+                )
+            except Exception as exc:
+                print(f"[WARN] Failed {job['slug']}: {exc}")
+                detail = None
+            finished[idx - 1] = detail or {}
+            flush_prefix()
+            if not detail:
+                return False
+            print(f"[{idx}/{total}] OK {job['slug']}")
+            return True
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
         try:
-            detail = fetch_job_detail(session, "", job)  # no build_id needed
-            detailed_rows.append(detail)
-            print(f"[{idx}/{len(listings)}] OK {job['slug']}")
-        except Exception as exc:
-            print(f"[WARN] Failed {job['slug']}: {exc}")
-        polite_sleep(1.5)
+            results = await asyncio.gather(
+                *(fetch_one(idx, job, executor) for idx, job in enumerate(listings, 1))
+            )
+        finally:
+            pool.close()
+    return sum(results)
+
+
+class JobifyScraper(Scraper):
+    name = "jobify"
+    fields = DETAIL_FIELDS
+    key = "slug"
+    list_csv = LIST_CSV
+    detail_csv = DETAIL_CSV
+
+    def __init__(self) -> None:
+        self.session = make_session()
+
+    def iter_listings(self, watermark: Optional[Watermark] = None) -> Iterator[Dict]:
+        # Direct page fetches first; clicking through the paginator is the fallback
+        listings = _scrape_jobs_http(self.session)
+        if not listings and not replay_enabled():
+            listings = _scrape_jobs_page(self.session)
+        _save_csv(listings, LIST_CSV, LIST_FIELDS)
+        yield from listings
+
+    def fetch_detail(self, listing: Dict) -> Optional[Dict]:
+        return fetch_job_detail(self.session, "", listing)  # no build_id needed
+
+    def fetch_details(self, listings: List[Dict], resume: bool = False,
+                      refresh: Iterable[str] = ()) -> int:
+        with CsvSink(DETAIL_CSV, DETAIL_FIELDS, key="slug", resume=resume, drop=refresh) as sink:
+            pending = [job for job in listings if job["slug"] not in sink]
+            if len(pending) < len(listings):
+                print(f"[INFO] Skipping {len(listings) - len(pending)} listings already in {DETAIL_CSV}")
+            written = asyncio.run(_fetch_details(self.session, pending, sink))
+        print(f"[OK] Wrote {written} rows -> {DETAIL_CSV} ({sink.rows} in total)")
+        return sink.rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scrape Jobify job listings and details.")
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="reuse the saved job list and only fetch details missing from the CSV",
+    )
+    add_common_args(parser)
+    args = parser.parse_args()
+    apply_common_args(args)
 
-    if detailed_rows:
-        _save_csv(detailed_rows, "jobify_jobs_detail.csv", DETAIL_FIELDS)
+    JobifyScraper().run(resume=args.resume)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,202 @@
+# Jobify/nuxt.py
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+NUXT_SCRIPT_RE = re.compile(r"window\.__NUXT__\s*=\s*(.+?);?\s*</script>", re.S)
+_IIFE_RE = re.compile(r"\(function\(([\w$,\s]*)\)\{")
+_IDENT_RE = re.compile(r"[A-Za-z_$][\w$]*")
+_NUMBER_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+_KEYWORDS = {"true": True, "false": False, "null": None, "undefined": None}
+
+
+class _JsReader:
+    """Tiny reader for the JS literals Nuxt 2 serializes into ``__NUXT__``.
+
+    It understands the ``(function(a,b,...){...;return {...}}(...))`` form:
+    arguments are bound to the parameter names, ``x.y=value;`` statements are
+    applied in order and the returned object is the state.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at offset {self.pos}")
+
+    def skip_ws(self) -> None:
+        while self.pos < len(self.text) and self.text[self.pos] in " \t\r\n":
+            self.pos += 1
+
+    def peek(self) -> str:
+        self.skip_ws()
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"expected {char!r}")
+        self.pos += 1
+
+    def ident(self) -> str:
+        self.skip_ws()
+        match = _IDENT_RE.match(self.text, self.pos)
+        if not match:
+            raise self.error("expected identifier")
+        self.pos = match.end()
+        return match.group(0)
+
+    def string(self) -> str:
+        quote = self.text[self.pos]
+        self.pos += 1
+        out: List[str] = []
+        while True:
+            if self.pos >= len(self.text):
+                raise self.error("unterminated string")
+            char = self.text[self.pos]
+            if char == quote:
+                self.pos += 1
+                break
+            if char != "\\":
+                out.append(char)
+                self.pos += 1
+                continue
+            esc = self.text[self.pos + 1]
+            if esc == "u":
+                out.append(chr(int(self.text[self.pos + 2:self.pos + 6], 16)))
+                self.pos += 6
+            elif esc == "x":
+                out.append(chr(int(self.text[self.pos + 2:self.pos + 4], 16)))
+                self.pos += 4
+            else:
+                out.append(_ESCAPES.get(esc, esc))
+                self.pos += 2
+        # Re-pair UTF-16 surrogates produced by \uXXXX escapes
+        return "".join(out).encode("utf-16", "surrogatepass").decode("utf-16")
+
+    def value(self, env: Dict[str, Any]) -> Any:
+        char = self.peek()
+        if char in "\"'":
+            return self.string()
+        if char == "{":
+            return self.obj(env)
+        if char == "[":
+            return self.array(env)
+        number = _NUMBER_RE.match(self.text, self.pos)
+        if number:
+            self.pos = number.end()
+            raw = number.group(0)
+            return float(raw) if any(c in raw for c in ".eE") else int(raw)
+        name = self.ident()
+        if name == "void":
+            self.value(env)
+            return None
+        if name in _KEYWORDS:
+            return _KEYWORDS[name]
+        if name in env:
+            return env[name]
+        raise self.error(f"unsupported expression {name!r}")
+
+    def obj(self, env: Dict[str, Any]) -> Dict[str, Any]:
+        self.expect("{")
+        result: Dict[str, Any] = {}
+        while self.peek() != "}":
+            char = self.peek()
+            if char in "\"'":
+                key = self.string()
+            elif char.isdigit():
+                key = _NUMBER_RE.match(self.text, self.pos).group(0)
+                self.pos += len(key)
+            else:
+                key = self.ident()
+            self.expect(":")
+            result[key] = self.value(env)
+            if self.peek() == ",":
+                self.pos += 1
+        self.pos += 1
+        return result
+
+    def array(self, env: Dict[str, Any]) -> List[Any]:
+        self.expect("[")
+        result: List[Any] = []
+        while self.peek() != "]":
+            result.append(self.value(env))
+            if self.peek() == ",":
+                self.pos += 1
+        self.pos += 1
+        return result
+
+    def skip_block(self) -> None:
+        """Jump over a ``{...}`` block, honouring strings."""
+        depth = 0
+        while self.pos < len(self.text):
+            char = self.text[self.pos]
+            if char in "\"'":
+                self.string()
+                continue
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    self.pos += 1
+                    return
+            self.pos += 1
+        raise self.error("unbalanced block")
+
+    def statements(self, env: Dict[str, Any]) -> Any:
+        while True:
+            name = self.ident()
+            if name == "return":
+                return self.value(env)
+            target = env[name]
+            keys = []
+            while self.peek() in ".[":
+                if self.text[self.pos] == ".":
+                    self.pos += 1
+                    keys.append(self.ident())
+                else:
+                    self.pos += 1
+                    keys.append(self.value(env))
+                    self.expect("]")
+            self.expect("=")
+            for key in keys[:-1]:
+                target = target[key]
+            target[keys[-1]] = self.value(env)
+            if self.peek() in ";,":
+                self.pos += 1
+
+
+def parse_nuxt_state(html: str) -> Optional[Dict[str, Any]]:
+    """Decode the ``window.__NUXT__`` state embedded in server-rendered HTML.
+
+    Returns None when the page carries no state or uses a form we can't read.
+    """
+    match = NUXT_SCRIPT_RE.search(html)
+    if not match:
+        return None
+    source = match.group(1).strip()
+    try:
+        if source.startswith("{"):
+            return json.loads(source)
+        header = _IIFE_RE.match(source)
+        if not header:
+            return None
+        params = [p.strip() for p in header.group(1).split(",") if p.strip()]
+        reader = _JsReader(source)
+        reader.pos = header.end() - 1
+        body_start = reader.pos
+        reader.skip_block()
+        reader.expect("(")
+        args: List[Any] = []
+        while reader.peek() != ")":
+            args.append(reader.value({}))
+            if reader.peek() == ",":
+                reader.pos += 1
+        env = dict(zip(params, args + [None] * (len(params) - len(args))))
+        reader.pos = body_start + 1
+        return reader.statements(env)
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
@@ -1,11 +1,18 @@
 # Jobify/utils.py
 import json
+import sys
 import time
+from pathlib import Path
 from typing import Dict, Optional
 
 import requests
 from bs4 import BeautifulSoup
 
+# Make the repo-level ``common`` package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.http_cache import CachingSession
+
 BASE_URL = "https://jobify.works"
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -20,7 +27,8 @@ DEFAULT_HEADERS = {
 
 
 def make_session() -> requests.Session:
-    session = requests.Session()
+    # GETs go through the on-disk response cache (and only to it with --replay)
+    session = CachingSession()
     session.headers.update(DEFAULT_HEADERS)
     return session
 
@@ -31,6 +39,12 @@ def fetch_json(session: requests.Session, url: str) -> Dict:
     return resp.json()
 
 
+def fetch_html(session: requests.Session, url: str) -> str:
+    resp = session.get(url, timeout=30)
+    resp.raise_for_status()
+    return resp.text
+
+
 def polite_sleep(seconds: float = 1.0) -> None:
     time.sleep(seconds)
 
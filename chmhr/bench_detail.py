@@ -0,0 +1,141 @@
+# Compare and time the detail parser against the previous one on saved
+# pages. Usage: python bench_detail.py [runs] [page.html ...]
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+from camhr_detail import HTML_PARSER, _clean_text, parse_job_detail
+
+JOB = {"id": "0", "title": "", "url": ""}
+
+
+def _legacy_parse(job: dict, html: str) -> dict:
+    """The previous parser: whole document with html.parser, then a div/span scan."""
+    detail = {
+        **job,
+        "company": "N/A",
+        "industry": "N/A",
+        "location": "N/A",
+        "salary": "N/A",
+        "job_type": "N/A",
+        "experience": "N/A",
+        "education": "N/A",
+        "posting_date": "N/A",
+        "description": "N/A",
+        "requirements": "N/A",
+    }
+    
+    soup = BeautifulSoup(html, "html.parser")
+    
+    # Extract company name - look for compnay-name class
+    company_elem = soup.select_one(".compnay-name")
+    if company_elem:
+        detail["company"] = _clean_text(company_elem.get_text())
+    
+    # Extract location - look in company-info section for location-item
+    location_items = soup.select(".location-item")
+    if location_items:
+        detail["location"] = _clean_text(location_items[0].get_text())
+    
+    # Extract salary - look for salary-fs-28 in job-title-content
+    salary_elem = soup.select_one(".salary-fs-28")
+    if salary_elem:
+        detail["salary"] = _clean_text(salary_elem.get_text())
+    
+    # Extract description - look in job-descript section
+    desc_elem = soup.select_one(".descript-list")
+    if desc_elem:
+        detail["description"] = _clean_text(desc_elem.get_text())[:500]
+    
+    # Look for structured fields in job-maininfo section
+    # CamHR displays: "Label" followed by "Value" text
+    job_maininfo = soup.select_one(".job-maininfo")
+    if job_maininfo:
+        # Get all text and split by common labels
+        maininfo_text = job_maininfo.get_text()
+        
+        # Look for specific labels - they appear without colons in CamHR
+        # Search for lines with labels like "Level", "Term", "Year of Exp.", etc.
+        lines = [line.strip() for line in maininfo_text.split('\n') if line.strip()]
+        
+        for i, line in enumerate(lines):
+            line_lower = line.lower()
+            
+            # Job type / Term (Full Time, Part Time, etc)
+            if "term" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if not any(kw in next_val.lower() for kw in ['company', 'profile', 'contact']):
+                    detail["job_type"] = _clean_text(next_val)
+            
+            # Experience / Year of Exp
+            if "year of exp" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if next_val and len(next_val) < 150 and not any(kw in next_val.lower() for kw in ['company', 'profile']):
+                    detail["experience"] = _clean_text(next_val)
+            
+            # Education / Qualification
+            if "qualification" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if next_val and len(next_val) < 100 and not any(kw in next_val.lower() for kw in ['company', 'profile']):
+                    detail["education"] = _clean_text(next_val)
+            
+            # Industry
+            if "industry" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if next_val and len(next_val) < 200 and not any(kw in next_val.lower() for kw in ['company', 'contact']):
+                    detail["industry"] = _clean_text(next_val)
+            
+            # Posting date / Level
+            if "level" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if next_val and len(next_val) < 100:
+                    detail["posting_date"] = _clean_text(next_val)  # Use posting_date for level since we don't have actual date
+    
+    # Also check for divs with label:value format as fallback
+    if not detail["job_type"] or detail["job_type"] == "N/A":
+        for elem in soup.find_all(["div", "span"]):
+            text = elem.get_text(strip=True)
+            if "term" in text.lower() and ":" in text and len(text) < 100:
+                parts = text.split(":", 1)
+                if len(parts) == 2:
+                    detail["job_type"] = _clean_text(parts[1])
+    
+    # Extract requirements - look for list items or detailed sections
+    req_sections = soup.select(".job-descript")
+    if len(req_sections) > 1:
+        req_list = req_sections[1].select("li")
+        if req_list:
+            detail["requirements"] = "\n".join(
+                _clean_text(li.get_text()) for li in req_list[:5]
+            )
+        else:
+            detail["requirements"] = _clean_text(req_sections[1].get_text())[:300]
+    
+    # Convert empty strings to "N/A" for consistency
+    for key in detail:
+        if isinstance(detail[key], str) and not detail[key].strip():
+            detail[key] = "N/A"
+    
+    return detail
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    paths = sys.argv[2:] or ["debug_camhr.html"]
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+
+        same = _legacy_parse(JOB, html) == parse_job_detail(JOB, html)
+        old = timeit.timeit(lambda: _legacy_parse(JOB, html), number=runs) / runs
+        new = timeit.timeit(lambda: parse_job_detail(JOB, html), number=runs) / runs
+
+        print(f"{path} ({len(html) / 1024:.0f} KB)")
+        print(f"  Output matches previous parser: {'yes' if same else 'NO'}")
+        print(f"  Previous parser:      {old * 1000:8.2f} ms")
+        print(f"  Strained ({HTML_PARSER}): {new * 1000:8.2f} ms  ({old / new:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
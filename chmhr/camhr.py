@@ -1,16 +1,109 @@
 # camhr.py
-from camhr_list import scrape_job_cards
-from camhr_detail import scrape_all_details
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import requests
+
+from camhr_list import CARD_HASH_FIELDS, LIST_CSV, SEEN_IDS_FILE, scrape_job_cards
+from camhr_detail import (
+    DETAIL_FIELDS, DETAILS_CSV, fetch_job_detail, load_api_template,
+    scrape_all_details, scrape_job_detail,
+)
+
+# Make the repo-level ``common`` package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.cli import add_common_args, apply_common_args
+from common.csv_sink import read_csv_rows
+from common.http_cache import replay_enabled
+from common.http_session import make_session
+from common.scraper import Scraper
+from common.seen_store import Watermark
+
+
+class CamHRScraper(Scraper):
+    name = "camhr"
+    fields = DETAIL_FIELDS
+    list_csv = LIST_CSV
+    detail_csv = DETAILS_CSV
+    seen_file = SEEN_IDS_FILE
+    card_fields = CARD_HASH_FIELDS
+
+    def __init__(self, tabs: int = 4, capture: bool = False, http: bool = True) -> None:
+        self.tabs = tabs
+        self.capture = capture
+        self.http = http
+        self._session = None
+        self._template: Optional[str] = None
+
+    def iter_listings(self, watermark: Optional[Watermark] = None) -> Iterator[Dict]:
+        if replay_enabled():
+            # The list only exists behind "load more" clicks, so replay the saved one
+            listings = read_csv_rows(LIST_CSV)
+            print(f"[INFO] Replay mode: {len(listings)} jobs from {LIST_CSV}")
+            yield from listings
+            return
+        yield from scrape_job_cards(max_clicks=550, watermark=watermark)
+
+    def fetch_detail(self, listing: Dict) -> Optional[Dict]:
+        if self.http and self._session is None:
+            self._session = make_session(1)
+            self._template = load_api_template(discover_with=listing)
+        if self._template:
+            try:
+                detail = fetch_job_detail(listing, self._session, self._template)
+            except (requests.RequestException, ValueError) as exc:
+                print(f"[WARN] API fetch failed for {listing['id']}: {exc}")
+                detail = None
+            if detail:
+                return detail
+        if replay_enabled():
+            return None
+        return scrape_job_detail(listing)
+
+    def fetch_details(self, listings: List[Dict], resume: bool = False,
+                      refresh: Iterable[str] = ()) -> int:
+        return scrape_all_details(listings, resume=resume, refresh=refresh, tabs=self.tabs,
+                                  capture=self.capture, http=self.http)
 
 
 def main():
-    jobs = scrape_job_cards(max_clicks=550, delay=5)
-    if not jobs:
-        print("No jobs collected—detail step skipped.")
-        return
+    parser = argparse.ArgumentParser(description="Scrape CamHR job listings and details.")
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="reuse the saved job list and only fetch details missing from the CSV",
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="keep existing detail rows; fetch only new jobs and jobs whose card changed",
+    )
+    parser.add_argument(
+        "--stop-after", type=int, default=0, metavar="N",
+        help="with --incremental, stop loading more after N consecutive already-known jobs",
+    )
+    parser.add_argument(
+        "--tabs", type=int, default=4, metavar="N",
+        help="render detail pages in N tabs of one browser (1 = one at a time)",
+    )
+    parser.add_argument(
+        "--capture", action="store_true",
+        help="read job data from the JSON the page loads instead of the rendered HTML",
+    )
+    parser.add_argument(
+        "--browser", action="store_true",
+        help="render every detail page in Chrome instead of calling the job JSON endpoint",
+    )
+    add_common_args(parser)
+    args = parser.parse_args()
+    if args.stop_after and not args.incremental:
+        parser.error("--stop-after only applies to --incremental runs")
+    apply_common_args(args)
 
-    scrape_all_details(jobs)
+    scraper = CamHRScraper(tabs=args.tabs, capture=args.capture, http=not args.browser)
+    scraper.run(resume=args.resume, incremental=args.incremental, stop_after=args.stop_after)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
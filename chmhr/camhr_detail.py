@@ -1,14 +1,58 @@
 # camhr_detail.py
-import csv
+import importlib.util
+import json
+import os
 import re
+import sys
 import time
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from selenium import webdriver
+import requests
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml is optional; html.parser is always available
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Make the repo-level ``common`` package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.csv_sink import CsvSink
+from common.driver_factory import create_driver
+from common.http_cache import replay_enabled
+from common.http_session import DETAIL_CONCURRENCY, DETAIL_MAX_RPS, fetch_all, make_session
+from common.lean_profile import TrafficMeter, block_resources, lean_enabled
+from common.network_capture import NetworkCapture, find_record, pick
+from common.rate_limit import HostRateLimiter
+from common.tab_pool import TAB_POOL_CHROME_ARGS, TabPool
+
+DETAILS_CSV = "camhr_jobs_details.csv"
+
+# The job JSON endpoint, with ``{id}`` for the job ID. Taken from
+# $CAMHR_DETAIL_API, else from API_CONFIG_FILE, which is written the first
+# time the endpoint is discovered from a rendered page's traffic. When no
+# endpoint is found that is recorded too, and discovery isn't retried for
+# API_RETRY_AFTER seconds.
+API_CONFIG_FILE = "camhr_api.json"
+API_RETRY_AFTER = 7 * 24 * 3600
+API_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Referer": "https://www.camhr.com/",
+}
+# Jobs tried first; if the endpoint serves none of them it is taken to be
+# stale and every job is rendered instead
+API_PROBE_JOBS = 3
+
+# Only these subtrees of a job page are parsed; every selector
+# `parse_job_detail` uses lives inside one of them
+DETAIL_STRAINER = SoupStrainer(class_=[
+    "job-header-content", "job-maininfo", "job-descript",
+    "compnay-name", "location-item", "salary-fs-28", "descript-list",
+])
 
 DETAIL_FIELDS = [
     "id", "title", "company", "industry", "location", "salary", "job_type",
@@ -16,24 +60,33 @@ DETAIL_FIELDS = [
     "requirements", "url"
 ]
 
+# Detail field -> keys the job JSON behind /a/job/<id> may use, first
+# non-empty wins. Matching ignores case and separators. The API is
+# undocumented, so these follow the labels the page shows.
+JSON_FIELD_KEYS = {
+    "company": ("companyName", "company.name", "company", "employerName"),
+    "industry": ("industryName", "industry", "company.industry"),
+    "location": ("locationName", "location", "workLocation", "city"),
+    "salary": ("salaryName", "salary", "salaryRange"),
+    "job_type": ("termName", "term", "jobType", "jobTerm"),
+    "experience": ("yearOfExpName", "yearOfExp", "experience"),
+    "education": ("qualificationName", "qualification", "education"),
+    # Same as the HTML path, which stores the job level here
+    "posting_date": ("levelName", "level"),
+    "description": ("description", "jobDescription"),
+    "requirements": ("requirement", "requirements", "jobRequirement"),
+}
+# Fewer mapped fields than this and the record is probably not the job itself
+MIN_JSON_FIELDS = 3
+
 def _clean_text(text):
     """Clean and normalize text."""
     if not text:
         return ""
     return re.sub(r'\s+', ' ', text.strip())[:200]
 
-def scrape_job_detail(job: Dict, driver=None) -> Dict:
-    """Scrape job detail from CamHR page using Selenium for client-side rendering."""
-    close_driver = False
-    
-    if driver is None:
-        # Create a new driver if not provided
-        options = webdriver.ChromeOptions()
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        driver = webdriver.Chrome(options=options)
-        close_driver = True
-    
+def parse_job_detail(job: Dict, html: str) -> Dict:
+    """Build a DETAIL_FIELDS row from a rendered CamHR job page."""
     detail = {
         **job,
         "company": "N/A",
@@ -48,100 +101,161 @@ def scrape_job_detail(job: Dict, driver=None) -> Dict:
         "requirements": "N/A",
     }
     
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=DETAIL_STRAINER)
+    
+    # Extract company name - look for compnay-name class
+    company_elem = soup.select_one(".compnay-name")
+    if company_elem:
+        detail["company"] = _clean_text(company_elem.get_text())
+    
+    # Extract location - look in company-info section for location-item
+    location_items = soup.select(".location-item")
+    if location_items:
+        detail["location"] = _clean_text(location_items[0].get_text())
+    
+    # Extract salary - look for salary-fs-28 in job-title-content
+    salary_elem = soup.select_one(".salary-fs-28")
+    if salary_elem:
+        detail["salary"] = _clean_text(salary_elem.get_text())
+    
+    # Extract description - look in job-descript section
+    desc_elem = soup.select_one(".descript-list")
+    if desc_elem:
+        detail["description"] = _clean_text(desc_elem.get_text())[:500]
+    
+    # Look for structured fields in job-maininfo section
+    # CamHR displays: "Label" followed by "Value" text
+    job_maininfo = soup.select_one(".job-maininfo")
+    lines = []
+    if job_maininfo:
+        # Get all text and split by common labels
+        maininfo_text = job_maininfo.get_text()
+        
+        # Look for specific labels - they appear without colons in CamHR
+        # Search for lines with labels like "Level", "Term", "Year of Exp.", etc.
+        lines = [line.strip() for line in maininfo_text.split('\n') if line.strip()]
+        
+        for i, line in enumerate(lines):
+            line_lower = line.lower()
+            
+            # Job type / Term (Full Time, Part Time, etc)
+            if "term" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if not any(kw in next_val.lower() for kw in ['company', 'profile', 'contact']):
+                    detail["job_type"] = _clean_text(next_val)
+            
+            # Experience / Year of Exp
+            if "year of exp" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if next_val and len(next_val) < 150 and not any(kw in next_val.lower() for kw in ['company', 'profile']):
+                    detail["experience"] = _clean_text(next_val)
+            
+            # Education / Qualification
+            if "qualification" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if next_val and len(next_val) < 100 and not any(kw in next_val.lower() for kw in ['company', 'profile']):
+                    detail["education"] = _clean_text(next_val)
+            
+            # Industry
+            if "industry" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if next_val and len(next_val) < 200 and not any(kw in next_val.lower() for kw in ['company', 'contact']):
+                    detail["industry"] = _clean_text(next_val)
+            
+            # Posting date / Level
+            if "level" in line_lower and i + 1 < len(lines):
+                next_val = lines[i + 1]
+                if next_val and len(next_val) < 100:
+                    detail["posting_date"] = _clean_text(next_val)  # Use posting_date for level since we don't have actual date
+    
+    # Also accept a "Term: Full Time" line as fallback
+    if not detail["job_type"] or detail["job_type"] == "N/A":
+        for line in lines:
+            if "term" in line.lower() and ":" in line and len(line) < 100:
+                detail["job_type"] = _clean_text(line.split(":", 1)[1])
+    
+    # Extract requirements - look for list items or detailed sections
+    req_sections = soup.select(".job-descript")
+    if len(req_sections) > 1:
+        req_list = req_sections[1].select("li")
+        if req_list:
+            detail["requirements"] = "\n".join(
+                _clean_text(li.get_text()) for li in req_list[:5]
+            )
+        else:
+            detail["requirements"] = _clean_text(req_sections[1].get_text())[:300]
+    
+    # Convert empty strings to "N/A" for consistency
+    for key in detail:
+        if isinstance(detail[key], str) and not detail[key].strip():
+            detail[key] = "N/A"
+    
+    return detail
+
+def _is_job_record(job_id: str):
+    """Predicate for the JSON object describing job ``job_id``."""
+    def matches(record: Dict) -> bool:
+        record_id = record.get("id") or record.get("jobId") or record.get("job_id")
+        return str(record_id) == job_id and bool(pick(record, "title", "jobTitle", "name"))
+    return matches
+
+def detail_from_json(job: Dict, record: Dict) -> Optional[Dict]:
+    """Map a captured job record onto DETAIL_FIELDS; None if too little matched."""
+    detail = {**job, **{field: "N/A" for field in JSON_FIELD_KEYS}}
+    found = 0
+    for field, keys in JSON_FIELD_KEYS.items():
+        value = pick(record, *keys)
+        if not value:
+            continue
+        if "<" in value:  # rich-text fields come as HTML
+            value = BeautifulSoup(value, "html.parser").get_text("\n")
+        if field == "requirements":
+            lines = [_clean_text(line) for line in value.split("\n") if line.strip()]
+            detail[field] = "\n".join(lines[:5])
+        elif field == "description":
+            detail[field] = _clean_text(value)[:500]
+        else:
+            detail[field] = _clean_text(value)
+        found += 1
+    return detail if found >= MIN_JSON_FIELDS else None
+
+def scrape_job_detail(job: Dict, driver=None, capture: Optional[NetworkCapture] = None) -> Optional[Dict]:
+    """Scrape job detail from CamHR page using Selenium for client-side rendering.
+
+    With a ``capture`` (driver started with ``capture_network=True``) the job
+    JSON the page loads is used as soon as it lands; the rendered HTML is
+    the fallback. None if the page couldn't be loaded, so no row is written
+    and a later ``--resume`` retries the job.
+    """
+    close_driver = False
+    
+    if driver is None:
+        # Create a new driver if not provided
+        driver = create_driver(headless=False, profile="camhr")
+        close_driver = True
+    
+    html = None
     try:
+        if capture is not None:
+            capture.discard()  # forget the previous page's traffic
         driver.get(job["url"])
         
+        if capture is not None:
+            record = capture.wait_for_record(
+                _is_job_record(str(job["id"])),
+                timeout=10,
+                stop=lambda: bool(driver.find_elements(By.CLASS_NAME, "job-header-content")),
+            )
+            detail = detail_from_json(job, record) if record else None
+            if detail:
+                return detail
+        
         # Wait for job content to load - look for job-header-content class
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.CLASS_NAME, "job-header-content"))
         )
         time.sleep(2)  # Extra wait for all content to render
-        
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # Extract company name - look for compnay-name class
-        company_elem = soup.select_one(".compnay-name")
-        if company_elem:
-            detail["company"] = _clean_text(company_elem.get_text())
-        
-        # Extract location - look in company-info section for location-item
-        location_items = soup.select(".location-item")
-        if location_items:
-            detail["location"] = _clean_text(location_items[0].get_text())
-        
-        # Extract salary - look for salary-fs-28 in job-title-content
-        salary_elem = soup.select_one(".salary-fs-28")
-        if salary_elem:
-            detail["salary"] = _clean_text(salary_elem.get_text())
-        
-        # Extract description - look in job-descript section
-        desc_elem = soup.select_one(".descript-list")
-        if desc_elem:
-            detail["description"] = _clean_text(desc_elem.get_text())[:500]
-        
-        # Look for structured fields in job-maininfo section
-        # CamHR displays: "Label" followed by "Value" text
-        job_maininfo = soup.select_one(".job-maininfo")
-        if job_maininfo:
-            # Get all text and split by common labels
-            maininfo_text = job_maininfo.get_text()
-            
-            # Look for specific labels - they appear without colons in CamHR
-            # Search for lines with labels like "Level", "Term", "Year of Exp.", etc.
-            lines = [line.strip() for line in maininfo_text.split('\n') if line.strip()]
-            
-            for i, line in enumerate(lines):
-                line_lower = line.lower()
-                
-                # Job type / Term (Full Time, Part Time, etc)
-                if "term" in line_lower and i + 1 < len(lines):
-                    next_val = lines[i + 1]
-                    if not any(kw in next_val.lower() for kw in ['company', 'profile', 'contact']):
-                        detail["job_type"] = _clean_text(next_val)
-                
-                # Experience / Year of Exp
-                if "year of exp" in line_lower and i + 1 < len(lines):
-                    next_val = lines[i + 1]
-                    if next_val and len(next_val) < 150 and not any(kw in next_val.lower() for kw in ['company', 'profile']):
-                        detail["experience"] = _clean_text(next_val)
-                
-                # Education / Qualification
-                if "qualification" in line_lower and i + 1 < len(lines):
-                    next_val = lines[i + 1]
-                    if next_val and len(next_val) < 100 and not any(kw in next_val.lower() for kw in ['company', 'profile']):
-                        detail["education"] = _clean_text(next_val)
-                
-                # Industry
-                if "industry" in line_lower and i + 1 < len(lines):
-                    next_val = lines[i + 1]
-                    if next_val and len(next_val) < 200 and not any(kw in next_val.lower() for kw in ['company', 'contact']):
-                        detail["industry"] = _clean_text(next_val)
-                
-                # Posting date / Level
-                if "level" in line_lower and i + 1 < len(lines):
-                    next_val = lines[i + 1]
-                    if next_val and len(next_val) < 100:
-                        detail["posting_date"] = _clean_text(next_val)  # Use posting_date for level since we don't have actual date
-        
-        # Also check for divs with label:value format as fallback
-        if not detail["job_type"] or detail["job_type"] == "N/A":
-            for elem in soup.find_all(["div", "span"]):
-                text = elem.get_text(strip=True)
-                if "term" in text.lower() and ":" in text and len(text) < 100:
-                    parts = text.split(":", 1)
-                    if len(parts) == 2:
-                        detail["job_type"] = _clean_text(parts[1])
-        
-        # Extract requirements - look for list items or detailed sections
-        req_sections = soup.select(".job-descript")
-        if len(req_sections) > 1:
-            req_list = req_sections[1].select("li")
-            if req_list:
-                detail["requirements"] = "\n".join(
-                    _clean_text(li.get_text()) for li in req_list[:5]
-                )
-            else:
-                detail["requirements"] = _clean_text(req_sections[1].get_text())[:300]
+        html = driver.page_source
         
     except Exception as e:
         print(f"Error scraping {job['url']}: {e}")
@@ -150,37 +264,213 @@ def scrape_job_detail(job: Dict, driver=None) -> Dict:
         if close_driver and driver:
             driver.quit()
     
-    # Convert empty strings to "N/A" for consistency
-    for key in detail:
-        if isinstance(detail[key], str) and not detail[key].strip():
-            detail[key] = "N/A"
-    
-    return detail
+    return parse_job_detail(job, html) if html is not None else None
 
-def scrape_all_details(jobs: List[Dict], pause=1.5) -> List[Dict]:
-    detailed = []
-    
+def _scrape_in_tabs(jobs: List[Dict], sink: CsvSink, tabs: int) -> None:
+    """Render jobs in ``tabs`` tabs of one browser, writing rows as pages finish."""
+    driver = create_driver(headless=False, extra_args=TAB_POOL_CHROME_ARGS, page_load_strategy="none",
+                           profile="camhr")
+    started = time.monotonic()
+    try:
+        pool = TabPool(driver, tabs, ready_selector=".job-header-content", quiet=1.0, timeout=20)
+        if lean_enabled():
+            # Blocking is per tab; the first one was set up with the driver
+            for handle in pool.handles[1:]:
+                driver.switch_to.window(handle)
+                block_resources(driver)
+        meter = TrafficMeter(driver, name="camhr-detail")
+        for idx, (job, html) in enumerate(pool.map(jobs, lambda job: job["url"]), 1):
+            if html is None:
+                # No row, so --resume tries the job again
+                print(f"Error scraping {job['url']}: page didn't finish rendering")
+            else:
+                sink.write(parse_job_detail(job, html))
+                rate = idx / max(time.monotonic() - started, 1e-6)
+                print(f"Fetched job {idx}/{len(jobs)}: {job['id']} ({rate:.2f} jobs/s)")
+            meter.record(pages=1)
+        if meter.enabled:
+            print(f"Traffic: {meter.summary()}")
+    finally:
+        driver.quit()
+
+def _scrape_in_browser(jobs: List[Dict], sink: CsvSink, pause: float, capture: bool) -> None:
+    """Render jobs one at a time in a single browser, ``pause`` apart."""
     # Use one driver instance to speed up scraping
-    options = webdriver.ChromeOptions()
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-    driver = webdriver.Chrome(options=options)
+    driver = create_driver(headless=False, capture_network=capture, profile="camhr")
+    network = NetworkCapture(driver) if capture else None
+    meter = TrafficMeter(driver, network, name="camhr-detail")
     
     try:
         for idx, job in enumerate(jobs, 1):
             try:
                 print(f"Fetching job {idx}/{len(jobs)}: {job['id']}")
-                detailed.append(scrape_job_detail(job, driver))
+                detail = scrape_job_detail(job, driver, network)
+                if detail:
+                    sink.write(detail)
+                meter.page(f"Job {job['id']}")
             except Exception as exc:
                 print(f"⚠️  Failed job {job['id']}: {exc}")
             time.sleep(pause)
+        if meter.enabled:
+            print(f"Traffic: {meter.summary()}")
+    finally:
+        driver.quit()
+
+def _template_from_url(url: str, job_id: str) -> Optional[str]:
+    """``url`` with the path segment or query value equal to ``job_id`` made ``{id}``."""
+    parts = urlsplit(url)
+    segments = parts.path.split("/")
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if job_id in segments:
+        path = "/".join("{id}" if segment == job_id else segment for segment in segments)
+        return urlunsplit(parts._replace(path=path))
+    if any(value == job_id for _, value in query):
+        query = [(key, "{id}" if value == job_id else value) for key, value in query]
+        return urlunsplit(parts._replace(query=urlencode(query, safe="{}")))
+    return None
+
+def _save_api_config(template: Optional[str]) -> None:
+    with open(API_CONFIG_FILE, "w", encoding="utf-8") as f:
+        json.dump({"detail_url": template, "checked": time.time()}, f, indent=2)
+
+def discover_api_template(job: Dict) -> Optional[str]:
+    """Render ``job`` once and find the JSON request that carried it.
+
+    The URL, with the job ID replaced by ``{id}``, is saved to
+    API_CONFIG_FILE for later runs. None if no such request was seen; if
+    the page rendered without one, that is saved as well.
+    """
+    job_id = str(job["id"])
+    driver = create_driver(headless=True, capture_network=True, profile="camhr")
+    try:
+        capture = NetworkCapture(driver)
+        driver.get(job["url"])
+        response = capture.wait_for_response(_is_job_record(job_id), timeout=20)
+    except Exception as exc:
+        # Chrome trouble says nothing about the site, so nothing is saved
+        print(f"[WARN] Couldn't render {job['url']} to find the job API: {exc}")
+        return None
     finally:
         driver.quit()
 
-    with open("camhr_jobs_details.csv", "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=DETAIL_FIELDS)
-        writer.writeheader()
-        writer.writerows(detailed)
+    template = _template_from_url(response["url"], job_id) if response else None
+    if template is None:
+        _save_api_config(None)
+        print(f"[WARN] No job JSON request seen; rendering pages (not checked again for "
+              f"{API_RETRY_AFTER // 86400} days, or delete {API_CONFIG_FILE})")
+        return None
+    _save_api_config(template)
+    print(f"[INFO] Found the job API: {template} (saved to {API_CONFIG_FILE})")
+    return template
+
+def load_api_template(discover_with: Optional[Dict] = None) -> Optional[str]:
+    """The configured job endpoint, discovering it from ``discover_with`` if unset.
+
+    Discovery needs a browser, so it is skipped in replay mode.
+    """
+    template = os.environ.get("CAMHR_DETAIL_API")
+    if template:
+        return template
+    if os.path.exists(API_CONFIG_FILE):
+        try:
+            with open(API_CONFIG_FILE, encoding="utf-8") as f:
+                config = json.load(f)
+            if config["detail_url"]:
+                return config["detail_url"]
+            if time.time() - config.get("checked", 0) < API_RETRY_AFTER:
+                return None  # no endpoint found recently; don't launch Chrome again
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            print(f"[WARN] Unreadable {API_CONFIG_FILE} ({exc}); ignoring it")
+    if discover_with and not replay_enabled():
+        return discover_api_template(discover_with)
+    return None
+
+def fetch_job_detail(job: Dict, session: requests.Session, template: str) -> Optional[Dict]:
+    """Fetch one job from the JSON endpoint; None if the record didn't map."""
+    url = template.replace("{id}", str(job["id"]))
+    resp = session.get(url, headers=API_HEADERS, timeout=20)
+    resp.raise_for_status()
+    record = find_record(resp.json(), _is_job_record(str(job["id"])))
+    return detail_from_json(job, record) if record else None
+
+def _fetch_over_http(jobs: List[Dict], sink: CsvSink, concurrency: int,
+                     max_rps: float) -> List[Dict]:
+    """Fetch jobs from the JSON endpoint; returns the ones left for the browser."""
+    if not jobs:
+        return jobs
+    template = load_api_template(discover_with=jobs[0])
+    if not template:
+        return jobs
+
+    session = make_session(concurrency)
+    limiter = HostRateLimiter(max_rps)
+
+    def fetch(job: Dict) -> Optional[Dict]:
+        try:
+            return fetch_job_detail(job, session, template)
+        except (requests.RequestException, ValueError) as exc:
+            print(f"  [WARN] API fetch failed for {job['id']}: {exc}")
+            return None
+
+    leftover = []
+
+    def fetch_batch(batch: List[Dict], start: int) -> None:
+        for _, job, detail in fetch_all(batch, fetch, lambda job: template, concurrency, max_rps,
+                                        start=start, total=len(jobs), limiter=limiter):
+            if detail:
+                sink.write(detail)
+            else:
+                leftover.append(job)  # rendered in the browser instead
+
+    try:
+        # A few jobs first, so a stale endpoint doesn't cost a failed request per job
+        probe = jobs[:API_PROBE_JOBS]
+        fetch_batch(probe, 1)
+        if len(leftover) == len(probe):
+            print(f"[WARN] {template} served none of the first {len(probe)} jobs; "
+                  f"check {API_CONFIG_FILE} or $CAMHR_DETAIL_API. Rendering pages instead")
+            return jobs
+        fetch_batch(jobs[len(probe):], len(probe) + 1)
+    finally:
+        session.close()
+    print(f"[INFO] {len(jobs) - len(leftover)}/{len(jobs)} jobs fetched over HTTP")
+    return leftover
+
+def scrape_all_details(jobs: List[Dict], pause=1.5, resume: bool = False,
+                       refresh: Iterable[str] = (), output_file: str = DETAILS_CSV,
+                       tabs: int = 1, capture: bool = False, http: bool = True,
+                       concurrency: int = DETAIL_CONCURRENCY,
+                       max_rps: float = DETAIL_MAX_RPS) -> int:
+    """Scrape details, appending each row to ``output_file``.
+
+    With ``http`` jobs are first fetched from the site's JSON endpoint,
+    ``concurrency`` at a time and at most ``max_rps`` per second; only the
+    jobs it can't serve are rendered in Chrome. With ``tabs`` > 1 the pages render
+    concurrently in that many tabs of one browser; otherwise one job at a
+    time with ``pause`` between them. ``capture`` reads the job JSON from
+    network traffic (one tab only). With ``resume`` the jobs already in the
+    file are skipped, except the IDs in ``refresh`` whose old rows are
+    dropped first. Returns the number of rows in the file.
+    """
+    sink = CsvSink(output_file, DETAIL_FIELDS, key="id", resume=resume, drop=refresh)
+    pending = [job for job in jobs if job["id"] not in sink]
+    if len(pending) < len(jobs):
+        print(f"Skipping {len(jobs) - len(pending)} jobs already in {output_file}")
+    
+    try:
+        if http:
+            pending = _fetch_over_http(pending, sink, concurrency, max_rps)
+        if pending and replay_enabled():
+            print(f"[WARN] Replay mode: {len(pending)} job(s) couldn't be served from the HTTP cache; not rendering them")
+        elif pending and tabs > 1 and not capture:
+            _scrape_in_tabs(pending, sink, tabs)
+        elif pending:
+            _scrape_in_browser(pending, sink, pause, capture)
+    except BaseException:
+        sink.close(commit=False)  # keep the previous CSV if this run dies
+        raise
+    finally:
+        sink.close()
 
-    print(f"Saved {len(detailed)} detailed jobs to camhr_jobs_details.csv")
-    return detailed
\ No newline at end of file
+    print(f"Saved {sink.rows} detailed jobs to {output_file}")
+    return sink.rows
@@ -1,58 +1,99 @@
 # camhr_list.py
 import csv
 import re
+import sys
 import time
+from pathlib import Path
+from typing import Optional
 from urllib.parse import urljoin
 
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+
+# Make the repo-level ``common`` package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.driver_factory import create_driver
+from common.lean_profile import TrafficMeter
+from common.seen_store import Watermark
+from common.waits import AdaptiveWaiter
 
 BASE_URL = "https://www.camhr.com"
 HOME_URL = BASE_URL + "/"
+LIST_CSV = "camhr_jobs_list.csv"
+# List cards only carry a title, so that's what marks a posting as edited
+SEEN_IDS_FILE = "camhr_seen_ids.json"
+CARD_HASH_FIELDS = ("title",)
 JOB_LINK_XPATH = "//a[contains(@href, '/job/') and not(contains(@href, 'jobwanted'))]"
+JOB_LINK_CSS = "a[href*='/job/']:not([href*='jobwanted'])"
+SHOW_MORE_XPATH = (
+    "//button[contains(translate(., 'LOADMORE', 'loadmore'), 'load more') "
+    "or contains(translate(., 'SHOWMORE', 'showmore'), 'show more')]"
+)
+
+# Hands back only the job anchors added since the previous call, as
+# {href, title}. The first call queues the anchors already on the page and
+# installs a MutationObserver that queues new ones as "load more" appends
+# them, so each call costs one round trip and work proportional to what's new.
+COLLECT_NEW_ANCHORS_JS = """
+var sel = arguments[0];
+var c = window.__jobCollector;
+if (!c) {
+    c = window.__jobCollector = {queue: []};
+    var push = function (a) {
+        c.queue.push({href: a.href, title: (a.innerText || a.textContent || '').trim()});
+    };
+    c.scan = function (node) {
+        if (node.nodeType !== 1) return;
+        if (node.matches(sel)) push(node);
+        var found = node.querySelectorAll(sel);
+        for (var i = 0; i < found.length; i++) push(found[i]);
+    };
+    c.scan(document.body);
+    new MutationObserver(function (records) {
+        for (var r = 0; r < records.length; r++) {
+            var rec = records[r];
+            if (rec.type === 'attributes') { c.scan(rec.target); continue; }
+            for (var n = 0; n < rec.addedNodes.length; n++) c.scan(rec.addedNodes[n]);
+        }
+    }).observe(document.body, {childList: true, subtree: true, attributes: true, attributeFilter: ['href']});
+}
+var out = c.queue;
+c.queue = [];
+return out;
+"""
+
+# Anchors queued by the observer but not collected yet (0 before the first collect)
+PENDING_ANCHORS_JS = "return window.__jobCollector ? window.__jobCollector.queue.length : 0;"
 
 def setup_driver(headless: bool = True) -> webdriver.Chrome:
-    options = Options()
-    options.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-    if headless:
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--start-maximized")
-
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.execute_script(
-        "Object.defineProperty(navigator, 'webdriver', {get: () => false});"
-    )
-    return driver
-
-def scrape_job_cards(max_clicks: int = 550, delay: float = 5.0):
+    return create_driver(headless=headless, profile="camhr")
+
+def scrape_job_cards(max_clicks: int = 550, delay: float = 0.5, watermark: Optional[Watermark] = None):
+    """Click "load more" until the list stops growing, collecting job cards.
+
+    Each click waits only until the new cards are in and the page is quiet;
+    ``delay`` is the least time kept between two clicks.
+    """
     driver = setup_driver(headless=False)
     jobs, seen_ids = [], set()
     wait = WebDriverWait(driver, 20)
+    waiter = AdaptiveWaiter(driver)
+    meter = TrafficMeter(driver, name="camhr-list")
 
     try:
         driver.get(HOME_URL)
         wait.until(EC.presence_of_element_located((By.XPATH, JOB_LINK_XPATH)))
+        waiter.install()
 
         for click in range(max_clicks):
-            anchors = driver.find_elements(By.XPATH, JOB_LINK_XPATH)
-            new_count = 0
+            clicked_at = time.monotonic()
+            new_ids = []
 
-            for anchor in anchors:
-                href = anchor.get_attribute("href") or ""
+            for record in driver.execute_script(COLLECT_NEW_ANCHORS_JS, JOB_LINK_CSS) or []:
+                href = record.get("href") or ""
                 match = re.search(r"/job/(\d+)", href)
                 if not match:
                     continue
@@ -61,51 +102,50 @@ def scrape_job_cards(max_clicks: int = 550, delay: float = 5.0):
                 if job_id in seen_ids:
                     continue
 
-                title = anchor.text.strip() or (
-                    anchor.get_attribute("innerText") or ""
-                ).strip()
-
                 jobs.append(
                     {
                         "id": job_id,
-                        "title": title or "N/A",
+                        "title": record.get("title") or "N/A",
                         "url": urljoin(BASE_URL, href),
                         "source": "CamHR",
                     }
                 )
                 seen_ids.add(job_id)
-                new_count += 1
+                new_ids.append(job_id)
 
-            print(f"[{click + 1}/{max_clicks}] +{new_count} new jobs (total={len(jobs)})")
-            if new_count == 0:
+            print(f"[{click + 1}/{max_clicks}] +{len(new_ids)} new jobs (total={len(jobs)})")
+            if not new_ids:
+                break
+            if watermark is not None and watermark.reached(new_ids):
+                print("Reached jobs seen in earlier runs; stopping.")
                 break
 
             try:
-                show_more = driver.find_element(
-                    By.XPATH,
-                    "//button[contains(translate(., 'LOADMORE', 'loadmore'), 'load more') "
-                    "or contains(translate(., 'SHOWMORE', 'showmore'), 'show more')]",
-                )
+                show_more = driver.find_element(By.XPATH, SHOW_MORE_XPATH)
                 driver.execute_script("arguments[0].click();", show_more)
             except Exception:
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
-            try:
-                wait.until(
-                    lambda d: len(d.find_elements(By.XPATH, JOB_LINK_XPATH)) > len(anchors)
-                )
-            except TimeoutException:
-                pass
-
-            time.sleep(delay)
+            waiter.settle(
+                progressed=lambda: driver.execute_script(PENDING_ANCHORS_JS) > 0,
+                # Gone or hidden once the last jobs are on the page
+                exhausted=lambda: not any(
+                    button.is_displayed() for button in driver.find_elements(By.XPATH, SHOW_MORE_XPATH)
+                ),
+            )
+            meter.record(pages=1)  # also keeps the performance log from piling up
+            time.sleep(max(0.0, delay - (time.monotonic() - clicked_at)))
 
     finally:
+        print(f"Load-more latency: {waiter.summary()}")
+        if meter.enabled:
+            print(f"Traffic: {meter.summary()}")
         driver.quit()
 
-    with open("camhr_jobs_list.csv", "w", newline="", encoding="utf-8") as f:
+    with open(LIST_CSV, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=["id", "title", "url", "source"])
         writer.writeheader()
         writer.writerows(jobs)
 
-    print(f"Saved {len(jobs)} job cards to camhr_jobs_list.csv")
+    print(f"Saved {len(jobs)} job cards to {LIST_CSV}")
     return jobs
\ No newline at end of file
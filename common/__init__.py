@@ -0,0 +1 @@
+# Helpers shared by the Jobify, BongThom and CamHR scrapers.
@@ -0,0 +1,35 @@
+# common/cli.py
+import argparse
+
+from common.driver_factory import set_persistent_profiles
+from common.http_cache import set_no_cache, set_replay
+from common.lean_profile import set_lean
+
+
+def add_common_args(parser: argparse.ArgumentParser) -> None:
+    """Add the cache and browser switches every entry point shares."""
+    parser.add_argument(
+        "--replay", action="store_true",
+        help="serve every page from the HTTP cache and never touch the network "
+             "(CamHR replays its saved job list and never opens Chrome)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="fetch every page from the network instead of the HTTP cache (the cache is still refreshed)",
+    )
+    parser.add_argument(
+        "--lean", action="store_true",
+        help="run Chrome headless in a small window, blocking images, fonts, media and trackers",
+    )
+    parser.add_argument(
+        "--warm-profile", action="store_true",
+        help="keep a persistent Chrome profile per site so cached scripts survive between runs",
+    )
+
+
+def apply_common_args(args: argparse.Namespace) -> None:
+    """Turn the switches from `add_common_args` on for this process."""
+    set_replay(args.replay)
+    set_no_cache(args.no_cache)
+    set_lean(args.lean)
+    set_persistent_profiles(args.warm_profile)
@@ -0,0 +1,208 @@
+# common/csv_sink.py
+import csv
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+
+def read_csv_rows(path: str) -> List[Dict[str, str]]:
+    """Rows of a CSV written by a previous run, or [] if there is none."""
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class CsvSink:
+    """Append rows to a CSV as they complete instead of writing it at the end.
+
+    Each row is flushed straight away, and a sidecar ``<path>.ckpt.json``
+    records the byte offset and row count of the last complete row. With
+    ``resume=True`` the file is cut back to that offset (dropping a row torn
+    by a crash) and the ``key`` column of the rows already written is loaded,
+    so callers can skip them with ``key in sink``. Rows whose key is in
+    ``drop`` are removed on resume so they can be fetched again.
+
+    A fresh run writes to ``<path>.part`` and only replaces ``path`` when
+    closed normally, so a run that dies early leaves the previous file
+    alone. ``resume=True`` folds such a ``.part`` file into ``path``, its
+    rows replacing those with the same key, so no complete row is lost.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fieldnames: Iterable[str],
+        key: str,
+        resume: bool = False,
+        drop: Iterable[str] = (),
+    ) -> None:
+        self.path = path
+        self.fieldnames = list(fieldnames)
+        self.key = key
+        self.checkpoint_path = f"{path}.ckpt.json"
+        self.part_path = f"{path}.part"
+        self._write_path = path
+        self.done: Set[str] = set()
+        self.rows = 0
+        self._lock = threading.Lock()
+
+        if resume and self._restore({str(k) for k in drop}):
+            self._file = open(path, "a", newline="", encoding="utf-8")
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction="ignore")
+            print(f"[INFO] Resuming {path}: {self.rows} rows already written")
+        else:
+            self._write_path = self.part_path
+            self._file = open(self.part_path, "w", newline="", encoding="utf-8")
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction="ignore")
+            self._writer.writeheader()
+            self._file.flush()
+            self._save_checkpoint(self._file.tell())
+
+    def _restore(self, drop: Set[str]) -> bool:
+        """Cut the CSV back to its checkpoint and load the keys written so far.
+
+        A CSV with the right header but no checkpoint (written in one go by
+        an older run) is adopted as complete. An interrupted fresh run's
+        ``.part`` file is newer than the CSV and is merged into it first.
+        """
+        if os.path.exists(self.part_path) and os.path.exists(self.checkpoint_path):
+            try:
+                with open(self.checkpoint_path, encoding="utf-8") as f:
+                    checkpoint = json.load(f)
+                partial = checkpoint.get("partial") and checkpoint.get("fieldnames") == self.fieldnames
+                part_offset = int(checkpoint["offset"])
+            except (OSError, ValueError, KeyError):
+                partial = False
+            if partial and self._header(self.path) == self.fieldnames:
+                self._merge_part(part_offset)
+            elif partial:
+                os.replace(self.part_path, self.path)
+                print(f"[INFO] Continuing the interrupted run saved in {self.part_path}")
+        if not os.path.exists(self.path):
+            return False
+        if os.path.exists(self.checkpoint_path):
+            try:
+                with open(self.checkpoint_path, encoding="utf-8") as f:
+                    checkpoint = json.load(f)
+                offset = int(checkpoint["offset"])
+            except (OSError, ValueError, KeyError) as exc:
+                print(f"[WARN] Unreadable checkpoint {self.checkpoint_path} ({exc}); starting over")
+                return False
+            if checkpoint.get("fieldnames") != self.fieldnames or os.path.getsize(self.path) < offset:
+                print(f"[WARN] {self.path} doesn't match its checkpoint; starting over")
+                return False
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+        else:
+            if self._header(self.path) != self.fieldnames:
+                print(f"[WARN] No checkpoint next to {self.path} and its columns differ; starting it over")
+                return False
+            print(f"[INFO] Adopting {self.path}, written without a checkpoint")
+            drop = drop or {""}  # force a rewrite so the file gets a checkpoint
+
+        if drop:
+            self._rewrite(drop)
+        else:
+            with open(self.path, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    self.done.add(row.get(self.key) or "")
+                    self.rows += 1
+        self.done.discard("")
+        return True
+
+    @staticmethod
+    def _header(path: str) -> Optional[List[str]]:
+        if not os.path.exists(path):
+            return None
+        with open(path, newline="", encoding="utf-8") as f:
+            return next(csv.reader(f), None)
+
+    def _merge_part(self, offset: int) -> None:
+        """Fold the interrupted run's ``.part`` rows into the CSV, newest row per key."""
+        if os.path.getsize(self.part_path) > offset:
+            with open(self.part_path, "r+b") as f:
+                f.truncate(offset)  # drop a row torn by the crash
+        newer = {row.get(self.key) or "": row for row in read_csv_rows(self.part_path)}
+        fresh = len(newer)
+        tmp_path = f"{self.path}.tmp"
+        with open(self.path, newline="", encoding="utf-8") as src, \
+                open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+            writer = csv.DictWriter(dst, fieldnames=self.fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            for row in csv.DictReader(src):
+                writer.writerow(newer.pop(row.get(self.key) or "", row))
+            writer.writerows(newer.values())
+            offset = dst.tell()
+        os.replace(tmp_path, self.path)
+        os.remove(self.part_path)
+        self._save_checkpoint(offset)
+        print(f"[INFO] Merged {fresh} rows from the interrupted run in {self.part_path} into {self.path}")
+
+    def _rewrite(self, drop: Set[str]) -> None:
+        """Stream the CSV into a fresh copy without the rows keyed in ``drop``."""
+        tmp_path = f"{self.path}.tmp"
+        dropped = 0
+        with open(self.path, newline="", encoding="utf-8") as src, \
+                open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+            writer = csv.DictWriter(dst, fieldnames=self.fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            for row in csv.DictReader(src):
+                row_key = row.get(self.key) or ""
+                if row_key in drop:
+                    dropped += 1
+                    continue
+                writer.writerow(row)
+                self.done.add(row_key)
+                self.rows += 1
+            offset = dst.tell()
+        os.replace(tmp_path, self.path)
+        self._save_checkpoint(offset)
+        if dropped:
+            print(f"[INFO] Dropped {dropped} stale rows from {self.path}")
+
+    def _save_checkpoint(self, offset: int) -> None:
+        checkpoint = {
+            "offset": offset,
+            "rows": self.rows,
+            "fieldnames": self.fieldnames,
+            "partial": self._write_path != self.path,
+        }
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def __contains__(self, key) -> bool:
+        return str(key) in self.done
+
+    def write(self, row: Dict) -> None:
+        with self._lock:
+            self._writer.writerow(row)
+            self._file.flush()
+            self.rows += 1
+            self.done.add(str(row.get(self.key, "")))
+            self._save_checkpoint(self._file.tell())
+
+    def close(self, commit: bool = True) -> None:
+        """Close the file; a fresh run's rows replace ``path`` only if ``commit``."""
+        if self._file.closed:
+            return
+        offset = self._file.tell()
+        self._file.close()
+        if self._write_path == self.path:
+            return
+        if not commit:
+            print(f"[WARN] Run stopped early; {self.rows} rows kept in {self.part_path} "
+                  f"(resume to continue), {self.path} left as it was")
+            return
+        os.replace(self.part_path, self.path)
+        self._write_path = self.path
+        self._save_checkpoint(offset)
+
+    def __enter__(self) -> "CsvSink":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        self.close(commit=exc_type is None)
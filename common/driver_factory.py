@@ -0,0 +1,240 @@
+# common/driver_factory.py
+import itertools
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import IO, Dict, Iterable, Optional, Tuple
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+from common.lean_profile import (
+    LEAN_CHROME_ARGS, LEAN_WINDOW_SIZE, block_resources, lean_enabled, metering_enabled,
+)
+from common.network_capture import PERFORMANCE_LOG_PREFS
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+CACHE_DIR = Path(os.environ.get("SCRAPER_CACHE_DIR", Path.home() / ".cache" / "scraping-job"))
+DRIVER_CACHE_FILE = CACHE_DIR / "chromedriver.json"
+# Persistent per-site profiles live in PROFILES_DIR/<site>/slot-<n>, one slot
+# per concurrently running browser (Chrome locks a profile to one process)
+PROFILES_DIR = CACHE_DIR / "profiles"
+DISK_CACHE_BYTES = 256 * 1024 * 1024
+# Chrome doesn't cap its code cache with --disk-cache-size; past this the
+# cache folders of a slot are cleared before it is used again
+PROFILE_MAX_BYTES = 3 * DISK_CACHE_BYTES
+_PROFILE_CACHE_DIRS = (
+    "Default/Cache", "Default/Code Cache", "Default/GPUCache", "Default/Service Worker/CacheStorage",
+)
+
+_driver_path: Optional[str] = None
+_lock = threading.Lock()
+_persistent_profiles = False
+
+
+def _chrome_version() -> str:
+    try:
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE) or ""
+    except Exception:
+        return ""
+
+
+def _read_cache() -> Dict:
+    try:
+        with open(DRIVER_CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(entry: Dict) -> None:
+    try:
+        DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = DRIVER_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, DRIVER_CACHE_FILE)
+    except OSError as exc:
+        print(f"[WARN] Could not cache chromedriver path: {exc}")
+
+
+def resolve_chromedriver(force: bool = False) -> str:
+    """Path to a chromedriver matching the installed Chrome.
+
+    Resolved once per process; across processes the path is reused from
+    DRIVER_CACHE_FILE as long as the Chrome version it was resolved for
+    still matches and the binary is still on disk.
+    """
+    global _driver_path
+    with _lock:
+        if _driver_path and not force:
+            return _driver_path
+        version = _chrome_version()
+        cached = {} if force else _read_cache()
+        path = cached.get("path")
+        if path and Path(path).exists() and cached.get("chrome_version") == version:
+            _driver_path = path
+        else:
+            print("[INFO] Resolving chromedriver binary...")
+            _driver_path = ChromeDriverManager().install()
+            _write_cache({"path": _driver_path, "chrome_version": version})
+        return _driver_path
+
+
+def set_persistent_profiles(enabled: bool = True) -> None:
+    """Give drivers created with a ``profile`` name a persistent, warm profile."""
+    global _persistent_profiles
+    _persistent_profiles = enabled
+
+
+def _try_lock(handle: IO) -> bool:
+    """Take an exclusive lock the OS drops when this process dies."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def lease_profile(site: str) -> Tuple[Path, IO]:
+    """Lock the first free profile slot for ``site``; close the handle to release it."""
+    site_dir = PROFILES_DIR / site
+    site_dir.mkdir(parents=True, exist_ok=True)
+    for slot in itertools.count():
+        handle = open(site_dir / f"slot-{slot}.lock", "a+")
+        if not _try_lock(handle):
+            handle.close()
+            continue
+        profile_dir = site_dir / f"slot-{slot}"
+        caches = [profile_dir / sub for sub in _PROFILE_CACHE_DIRS if (profile_dir / sub).exists()]
+        if sum(_dir_size(path) for path in caches) > PROFILE_MAX_BYTES:
+            print(f"[INFO] Clearing the caches of {profile_dir}")
+            for path in caches:
+                shutil.rmtree(path, ignore_errors=True)
+        return profile_dir, handle
+
+
+def build_options(
+    headless: bool = True,
+    user_agent: str = USER_AGENT,
+    extra_args: Iterable[str] = (),
+    page_load_strategy: str = "normal",
+    capture_network: bool = False,
+    lean: bool = False,
+    user_data_dir: Optional[Path] = None,
+) -> Options:
+    """The one Chrome option set every scraper launches with."""
+    options = Options()
+    options.page_load_strategy = page_load_strategy
+    if capture_network:
+        options.set_capability("goog:loggingPrefs", PERFORMANCE_LOG_PREFS)
+    options.add_argument(f"--user-agent={user_agent}")
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    if lean:
+        options.add_argument(f"--window-size={LEAN_WINDOW_SIZE}")
+        for arg in LEAN_CHROME_ARGS:
+            options.add_argument(arg)
+    else:
+        options.add_argument("--start-maximized")
+        options.add_argument("--window-size=1920,1080")
+    # Skip first-run work Chrome would otherwise do on every fresh profile
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    options.add_argument("--disable-extensions")
+    if user_data_dir is not None:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+        options.add_argument(f"--disk-cache-size={DISK_CACHE_BYTES}")
+        # A killed run leaves the profile "crashed"; don't offer to restore it
+        options.add_argument("--hide-crash-restore-bubble")
+    for arg in extra_args:
+        options.add_argument(arg)
+    return options
+
+
+def create_driver(
+    headless: bool = True,
+    user_agent: str = USER_AGENT,
+    extra_args: Iterable[str] = (),
+    page_load_strategy: str = "normal",
+    capture_network: bool = False,
+    lean: Optional[bool] = None,
+    profile: Optional[str] = None,
+) -> webdriver.Chrome:
+    """Start Chrome with the shared option set and the cached chromedriver.
+
+    ``page_load_strategy="none"`` makes navigation commands return at once,
+    for callers that poll readiness themselves (see `common.tab_pool`).
+    ``capture_network`` records DevTools Network events for
+    `common.network_capture.NetworkCapture`.
+    ``lean`` (by default whatever `common.lean_profile.set_lean` chose)
+    runs headless in a small window with images, fonts, media and tracker
+    hosts blocked. Lean runs, and full ones with SCRAPER_TRAFFIC=1, record
+    traffic for `common.lean_profile.TrafficMeter`.
+    With persistent profiles on (`set_persistent_profiles`), ``profile``
+    names the site whose profile slots the driver leases, so its HTTP and
+    code caches survive between launches; the slot is freed on ``quit()``.
+    """
+    if lean is None:
+        lean = lean_enabled()
+    user_data_dir, lease = None, None
+    if profile and _persistent_profiles:
+        user_data_dir, lease = lease_profile(profile)
+    options = build_options(
+        headless=headless or lean,
+        user_agent=user_agent,
+        extra_args=extra_args,
+        page_load_strategy=page_load_strategy,
+        capture_network=capture_network or lean or metering_enabled(),
+        lean=lean,
+        user_data_dir=user_data_dir,
+    )
+    try:
+        try:
+            driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+        except SessionNotCreatedException:
+            # Chrome was probably updated since the cached driver was resolved
+            driver = webdriver.Chrome(service=Service(resolve_chromedriver(force=True)), options=options)
+    except Exception:
+        if lease is not None:
+            lease.close()
+        raise
+    if lease is not None:
+        quit_chrome = driver.quit
+
+        def quit() -> None:
+            try:
+                quit_chrome()
+            finally:
+                lease.close()
+
+        driver.quit = quit
+    driver.execute_script(
+        "Object.defineProperty(navigator, 'webdriver', {get: () => false});"
+    )
+    if lean:
+        block_resources(driver)
+    return driver
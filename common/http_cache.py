@@ -0,0 +1,272 @@
+# common/http_cache.py
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import zstandard
+except ImportError:  # optional; gzip is always available
+    zstandard = None
+
+# Same root as the chromedriver cache; override with SCRAPER_CACHE_DIR
+HTTP_CACHE_DIR = Path(
+    os.environ.get("SCRAPER_CACHE_DIR", Path.home() / ".cache" / "scraping-job")
+) / "http"
+
+# How long a cached page is served before it is fetched again, per host
+SITE_TTLS: Dict[str, float] = {
+    "jobify.works": 6 * 3600,
+    "www.bongthom.com": 6 * 3600,
+    "www.camhr.com": 6 * 3600,
+}
+DEFAULT_TTL = 12 * 3600
+# Listing pages change with every new job, so they are always refetched
+# (still stored, for --replay). Incremental runs rely on a fresh page 1.
+LISTING_PATHS: Dict[str, Tuple[str, ...]] = {
+    "jobify.works": ("/jobs",),
+    "www.bongthom.com": ("/job_list.html",),
+}
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+# "gzip", or "zstd" (smaller, faster to read; needs the zstandard package)
+CACHE_CODEC = os.environ.get("SCRAPER_CACHE_CODEC", "gzip").lower()
+
+# Serve every GET from the cache only; set by the scripts' --replay flag
+_replay = os.environ.get("SCRAPER_REPLAY") == "1"
+# Never read the cache (responses are still stored); the --no-cache flag
+_no_cache = os.environ.get("SCRAPER_NO_CACHE") == "1"
+_default_cache: Optional["HttpCache"] = None
+_default_lock = threading.Lock()
+
+
+class CacheMiss(requests.RequestException):
+    """Raised in replay mode for a URL that isn't in the cache."""
+
+
+def set_replay(enabled: bool) -> None:
+    global _replay
+    _replay = enabled
+
+
+def replay_enabled() -> bool:
+    return _replay
+
+
+def set_no_cache(enabled: bool) -> None:
+    global _no_cache
+    _no_cache = enabled
+
+
+def no_cache_enabled() -> bool:
+    return _no_cache
+
+
+def default_cache() -> "HttpCache":
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache()
+        return _default_cache
+
+
+class HttpCache:
+    """Compressed response bodies on disk, one file per URL.
+
+    Entries are named by the SHA-256 of the URL and hold a JSON header line
+    (URL, status, headers, encoding) followed by the body. Freshness comes
+    from the file's write time and the host's TTL; reads bump the access
+    time, and once the cache outgrows ``max_bytes`` the least recently used
+    entries are removed.
+    """
+
+    def __init__(
+        self,
+        root: Path = HTTP_CACHE_DIR,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        max_bytes: int = MAX_CACHE_BYTES,
+        codec: str = CACHE_CODEC,
+    ) -> None:
+        if codec not in ("gzip", "zstd"):
+            print(f"[WARN] Unknown cache codec {codec!r}; caching with gzip")
+            codec = "gzip"
+        elif codec == "zstd" and zstandard is None:
+            print("[WARN] zstandard is not installed; caching with gzip")
+            codec = "gzip"
+        self.root = Path(root)
+        self.ttls = SITE_TTLS if ttls is None else ttls
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.codec = codec
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _path(self, url: str, codec: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / f"{digest}.{'zst' if codec == 'zstd' else 'gz'}"
+
+    def _find(self, url: str) -> Optional[Path]:
+        for codec in (self.codec, "gzip", "zstd"):
+            path = self._path(url, codec)
+            if path.exists():
+                return path
+        return None
+
+    def ttl(self, url: str) -> float:
+        parts = urlparse(url)
+        host = parts.netloc.lower()
+        if parts.path.rstrip("/") in LISTING_PATHS.get(host, ()):
+            return 0
+        return self.ttls.get(host, self.default_ttl)
+
+    def _drop(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def get(self, url: str, allow_stale: bool = False) -> Optional[Tuple[Dict, bytes]]:
+        """Header and body cached for ``url``, or None if missing or expired."""
+        path = self._find(url)
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+            if not allow_stale and time.time() - stat.st_mtime > self.ttl(url):
+                return None
+            raw = path.read_bytes()
+        except OSError:
+            return None
+        if path.suffix == ".zst" and zstandard is None:
+            return None
+        try:
+            if path.suffix == ".zst":
+                data = zstandard.ZstdDecompressor().decompress(raw)
+            else:
+                data = gzip.decompress(raw)
+            header_line, _, body = data.partition(b"\n")
+            header = json.loads(header_line)
+        except Exception as exc:  # gzip/zstd/JSON errors: a truncated or corrupt entry
+            print(f"[WARN] Dropping unreadable cache entry for {url}: {exc}")
+            self._drop(path)
+            return None
+        try:
+            # Keep the write time (freshness) but record the read for eviction
+            os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            pass  # evicted by another process meanwhile; the body is already read
+        return header, body
+
+    def put(self, url: str, resp: requests.Response) -> None:
+        header = {
+            "url": url,
+            "status": resp.status_code,
+            "headers": {k: v for k, v in resp.headers.items() if k.lower() == "content-type"},
+            "encoding": resp.encoding,
+        }
+        data = json.dumps(header).encode("utf-8") + b"\n" + resp.content
+        if self.codec == "zstd":
+            blob = zstandard.ZstdCompressor(level=10).compress(data)
+        else:
+            blob = gzip.compress(data, compresslevel=6)
+
+        path = self._path(url, self.codec)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        old_size = path.stat().st_size if path.exists() else 0
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(blob) - old_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        return [p for p in self.root.glob("*/*") if p.suffix in (".gz", ".zst")]
+
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self._entries())
+
+    def _evict(self) -> None:
+        """Drop least recently read entries until the cache is back under 90% of its cap."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, path))
+        entries.sort()
+        target = int(self.max_bytes * 0.9)
+        size = sum(entry[1] for entry in entries)
+        removed = 0
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= entry_size
+            removed += 1
+        self._size = size
+        print(f"[INFO] HTTP cache over {self.max_bytes // (1024 * 1024)} MB; evicted {removed} entries")
+
+
+def _cached_response(url: str, header: Dict, body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = header.get("status", 200)
+    resp.url = url
+    resp.headers = CaseInsensitiveDict(header.get("headers") or {})
+    resp.encoding = header.get("encoding")
+    resp._content = body
+    resp.reason = "OK (cached)"
+    return resp
+
+
+class CachingSession(requests.Session):
+    """`requests.Session` that answers GETs from an `HttpCache` when it can.
+
+    Only successful responses are stored. In replay mode nothing goes to the
+    network and a miss raises `CacheMiss`; with ``no_cache`` every GET goes
+    to the network and only refreshes the cache.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[HttpCache] = None,
+        replay: Optional[bool] = None,
+        no_cache: Optional[bool] = None,
+    ) -> None:
+        super().__init__()
+        self.cache = cache or default_cache()
+        self.replay = replay_enabled() if replay is None else replay
+        self.no_cache = no_cache_enabled() if no_cache is None else no_cache
+
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != "GET":
+            return super().request(method, url, *args, **kwargs)
+        full_url = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+
+        cached = None if self.no_cache and not self.replay else self.cache.get(full_url, allow_stale=self.replay)
+        if cached is not None:
+            return _cached_response(full_url, *cached)
+        if self.replay:
+            raise CacheMiss(f"Not in the HTTP cache (replay mode): {full_url}")
+
+        resp = super().request(method, url, *args, **kwargs)
+        if resp.status_code == 200:
+            self.cache.put(full_url, resp)
+        return resp
@@ -0,0 +1,69 @@
+# common/http_session.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from common.driver_factory import USER_AGENT
+from common.http_cache import CachingSession
+from common.rate_limit import HostRateLimiter
+
+# Same browser identity as the Selenium scrapers
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9",
+}
+# Detail requests in flight at once, and the most sent per second to one host
+DETAIL_CONCURRENCY = 8
+DETAIL_MAX_RPS = 4.0
+
+
+def make_session(pool_size: int = DETAIL_CONCURRENCY) -> requests.Session:
+    """Caching session that retries 429/5xx with backoff, pooled for ``pool_size`` threads."""
+    session = CachingSession()
+    session.headers.update(HEADERS)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.8,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=False,
+    )
+    # One pooled connection per worker so threads never wait on each other
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_all(
+    jobs: List[Dict],
+    fetch: Callable[[Dict], Optional[Dict]],
+    url: Callable[[Dict], str],
+    concurrency: int = DETAIL_CONCURRENCY,
+    max_rps: float = DETAIL_MAX_RPS,
+    start: int = 1,
+    total: Optional[int] = None,
+    limiter: Optional[HostRateLimiter] = None,
+) -> Iterator[Tuple[int, Dict, Optional[Dict]]]:
+    """Run ``fetch`` over ``jobs`` ``concurrency`` at a time, at most ``max_rps`` per host.
+
+    ``url(job)`` names the request for the rate limiter; pass ``limiter``
+    to share one across calls. Yields ``(index, job, result)`` in the order
+    of ``jobs``, numbered from ``start`` (out of ``total``), and prints each
+    job's progress and the running rate.
+    """
+    limiter = limiter or HostRateLimiter(max_rps)
+    total = total or start + len(jobs) - 1
+
+    def limited(job: Dict) -> Optional[Dict]:
+        limiter.acquire(url(job))
+        return fetch(job)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for idx, (job, result) in enumerate(zip(jobs, executor.map(limited, jobs)), start):
+            rate = (idx - start + 1) / max(time.monotonic() - started, 1e-6)
+            print(f"[{idx}/{total}] {'Fetched' if result else 'Failed'} job {job['id']} ({rate:.1f} jobs/s)")
+            yield idx, job, result
@@ -0,0 +1,146 @@
+# common/lean_profile.py
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from common.http_cache import HTTP_CACHE_DIR
+from common.network_capture import NetworkCapture
+
+# Requests Chrome refuses to send in the lean profile: images, web fonts,
+# media and the analytics/ad hosts the job boards embed. None of them carry
+# job data.
+LEAN_BLOCKED_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*",
+    "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*clarity.ms*",
+    "*tiktok.com*", "*cdn.onesignal.com*",
+)
+# Small, but still wide enough for the sites' desktop (>= 1200px) layouts,
+# whose selectors the scrapers rely on
+LEAN_WINDOW_SIZE = "1280,800"
+LEAN_CHROME_ARGS = (
+    # Also drops images the URL patterns miss (CSS backgrounds, data URLs)
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+    "--autoplay-policy=user-gesture-required",
+    "--disable-remote-fonts",
+)
+
+# Per-page traffic of the last metered run of each crawl, lean and full, so a
+# lean run can report what blocking saved. SCRAPER_TRAFFIC=1 meters full runs.
+TRAFFIC_FILE = HTTP_CACHE_DIR.parent / "traffic.json"
+
+_lean = False
+
+
+def set_lean(enabled: bool = True) -> None:
+    """Start every browser with the lean profile (the ``--lean`` flags)."""
+    global _lean
+    _lean = enabled
+
+
+def lean_enabled() -> bool:
+    return _lean
+
+
+def metering_enabled() -> bool:
+    """Whether browsers record traffic for `TrafficMeter`: lean runs, or SCRAPER_TRAFFIC=1."""
+    return _lean or os.environ.get("SCRAPER_TRAFFIC") == "1"
+
+
+def block_resources(driver: webdriver.Chrome, patterns: Iterable[str] = LEAN_BLOCKED_URLS) -> None:
+    """Block ``patterns`` in the current tab; repeat for every new tab."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    except WebDriverException as exc:
+        print(f"[WARN] Couldn't block resources ({exc.msg}); loading full pages")
+
+
+def _load_traffic() -> Dict[str, Dict]:
+    try:
+        with open(TRAFFIC_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class TrafficMeter:
+    """Requests, bytes and blocked requests per page, from the performance log.
+
+    Inert unless the lean profile is on, SCRAPER_TRAFFIC=1 is set or
+    ``enabled`` is passed. Share the `NetworkCapture` if the driver already
+    has one, since both read the same log. With a ``name`` the per-page
+    average is saved to TRAFFIC_FILE, and the summary compares lean and
+    full runs of that crawl.
+    """
+
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        capture: Optional[NetworkCapture] = None,
+        enabled: Optional[bool] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        self.enabled = metering_enabled() if enabled is None else enabled
+        self.capture = capture or (NetworkCapture(driver, bodies=False) if self.enabled else None)
+        self.name = name
+        self.totals = {"requests": 0, "bytes": 0, "blocked": 0}
+        self.pages = 0
+
+    def record(self, pages: int = 0) -> Dict[str, int]:
+        """Add the traffic since the last call (and ``pages``) to the totals and return it."""
+        if not self.enabled:
+            return {}
+        self.capture.discard()  # the scraper has read any bodies it wanted by now
+        traffic = self.capture.take_traffic()
+        for key, value in traffic.items():
+            self.totals[key] += value
+        self.pages += pages
+        return traffic
+
+    def page(self, label: str) -> None:
+        """Record and print one page's traffic."""
+        if not self.enabled:
+            return
+        traffic = self.record(pages=1)
+        print(f"[INFO] {label}: {traffic['requests']} requests, "
+              f"{traffic['bytes'] / 1024:.0f} KB, {traffic['blocked']} blocked")
+
+    def summary(self) -> str:
+        self.record()
+        text = (f"{self.totals['requests']} requests, {self.totals['bytes'] / 1024:.0f} KB, "
+                f"{self.totals['blocked']} blocked")
+        if self.pages:
+            text += (f" ({self.totals['bytes'] / 1024 / self.pages:.0f} KB and "
+                     f"{self.totals['blocked'] / self.pages:.1f} blocked per page)")
+            if self.name:
+                text += self._compare()
+        return text
+
+    def _compare(self) -> str:
+        """Save this run's KB per page and compare it with the other profile's."""
+        mode, other = ("lean", "full") if lean_enabled() else ("full", "lean")
+        kb_per_page = self.totals["bytes"] / 1024 / self.pages
+        runs = _load_traffic()
+        runs.setdefault(self.name, {})[mode] = round(kb_per_page, 1)
+        try:
+            TRAFFIC_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(TRAFFIC_FILE, "w", encoding="utf-8") as f:
+                json.dump(runs, f, indent=2)
+        except OSError:
+            pass
+        baseline = runs[self.name].get(other)
+        if not baseline:
+            return ""
+        lean_kb, full_kb = (kb_per_page, baseline) if mode == "lean" else (baseline, kb_per_page)
+        saved = full_kb - lean_kb
+        return (f"; lean saves {saved:.0f} KB per page ({saved / full_kb:.0%}) "
+                f"against the last {other} run")
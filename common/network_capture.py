@@ -0,0 +1,197 @@
+# common/network_capture.py
+import base64
+import json
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+# Capability that makes chromedriver record DevTools Network events in the
+# "performance" log; `create_driver(capture_network=True)` sets it.
+PERFORMANCE_LOG_PREFS = {"performance": "ALL"}
+
+_JSON_MIME_RE = re.compile(r"[/+]json\b", re.I)
+
+
+def _normalize_key(key: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", key.lower())
+
+
+def find_record(data: Any, predicate: Callable[[Dict], bool]) -> Optional[Dict]:
+    """First dict inside a decoded JSON document (depth first) matching ``predicate``."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if predicate(node):
+                return node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return None
+
+
+def pick(record: Dict, *paths: str) -> str:
+    """First non-empty value among dotted ``paths``, as text.
+
+    Key matching ignores case and separators, so ``companyName`` also finds
+    ``company_name``. Lists are joined with ", " and dicts with a ``name``
+    use that.
+    """
+    for path in paths:
+        node: Any = record
+        for part in path.split("."):
+            if not isinstance(node, dict):
+                node = None
+                break
+            wanted = _normalize_key(part)
+            node = next((v for k, v in node.items() if _normalize_key(str(k)) == wanted), None)
+        if isinstance(node, dict):
+            node = node.get("name")
+        if isinstance(node, list):
+            node = ", ".join(
+                str(item.get("name") if isinstance(item, dict) else item) for item in node if item
+            )
+        if node not in (None, "", []):
+            return str(node).strip()
+    return ""
+
+
+class NetworkCapture:
+    """JSON responses a page loaded, read from chromedriver's performance log.
+
+    The driver must be started with `create_driver(capture_network=True)`.
+    `drain` parses the log since the previous call and fetches each finished
+    JSON body with ``Network.getResponseBody``; `discard` skips the bodies,
+    so call it before navigating to drop the previous page's traffic. Both
+    count requests, bytes received and blocked requests (see
+    `take_traffic`); with ``bodies=False`` that is all `drain` does.
+    """
+
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        url_pattern: Optional[str] = None,
+        bodies: bool = True,
+    ) -> None:
+        self.driver = driver
+        self.url_re = re.compile(url_pattern) if url_pattern else None
+        self.bodies = bodies
+        self.traffic = {"requests": 0, "bytes": 0, "blocked": 0}
+        self._responses: Dict[str, Dict] = {}
+        self._warned = False
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+        except WebDriverException:
+            pass
+
+    def _events(self) -> Iterable[Dict]:
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException as exc:
+            if not self._warned:
+                print(f"[WARN] Performance log unavailable ({exc.msg}); was capture enabled?")
+                self._warned = True
+            return []
+        events = []
+        for entry in entries:
+            try:
+                events.append(json.loads(entry["message"])["message"])
+            except (KeyError, ValueError):
+                continue
+        return events
+
+    def _body(self, request_id: str) -> Optional[Any]:
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except WebDriverException:
+            return None  # evicted from the buffer or never had a body
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8", "replace")
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+    def drain(self, bodies: Optional[bool] = None) -> List[Dict]:
+        """JSON responses finished since the last call: ``{url, status, data}``.
+
+        ``bodies`` overrides the constructor's setting for this call.
+        """
+        bodies = self.bodies if bodies is None else bodies
+        captured = []
+        for event in self._events():
+            method = event.get("method")
+            params = event.get("params") or {}
+            if method == "Network.requestWillBeSent":
+                self.traffic["requests"] += 1
+            elif method == "Network.loadingFailed":
+                self._responses.pop(params.get("requestId"), None)
+                if params.get("blockedReason"):
+                    self.traffic["blocked"] += 1
+            elif method == "Network.responseReceived" and bodies:
+                response = params.get("response") or {}
+                url = response.get("url", "")
+                if not _JSON_MIME_RE.search(response.get("mimeType", "")):
+                    continue
+                if self.url_re and not self.url_re.search(url):
+                    continue
+                self._responses[params.get("requestId")] = {"url": url, "status": response.get("status")}
+            elif method == "Network.loadingFinished":
+                self.traffic["bytes"] += int(params.get("encodedDataLength") or 0)
+                meta = self._responses.pop(params.get("requestId"), None)
+                if meta is None:
+                    continue
+                data = self._body(params["requestId"])
+                if data is not None:
+                    captured.append({**meta, "data": data})
+        return captured
+
+    def discard(self) -> None:
+        """Forget the traffic logged so far without fetching any bodies; it is still counted."""
+        self.drain(bodies=False)
+        self._responses.clear()
+
+    def take_traffic(self) -> Dict[str, int]:
+        """Traffic counted by `drain` since the last call."""
+        traffic, self.traffic = self.traffic, {"requests": 0, "bytes": 0, "blocked": 0}
+        return traffic
+
+    def wait_for_response(
+        self,
+        predicate: Callable[[Dict], bool],
+        timeout: float = 10.0,
+        stop: Optional[Callable[[], bool]] = None,
+        poll: float = 0.2,
+    ) -> Optional[Dict]:
+        """Poll until a captured JSON response contains a record matching ``predicate``.
+
+        Returns the response (``{url, status, data, record}``). Gives up after
+        ``timeout`` or once ``stop()`` is true (say, the page has rendered
+        without any matching XHR); responses that finished before ``stop``
+        turned true are still checked.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            done = stop() if stop is not None else False
+            for response in self.drain():
+                record = find_record(response["data"], predicate)
+                if record is not None:
+                    return {**response, "record": record}
+            if done or time.monotonic() >= deadline:
+                return None
+            time.sleep(poll)
+
+    def wait_for_record(
+        self,
+        predicate: Callable[[Dict], bool],
+        timeout: float = 10.0,
+        stop: Optional[Callable[[], bool]] = None,
+        poll: float = 0.2,
+    ) -> Optional[Dict]:
+        """Like `wait_for_response`, returning just the matching record."""
+        response = self.wait_for_response(predicate, timeout, stop, poll)
+        return response["record"] if response else None
@@ -0,0 +1,68 @@
+# common/rate_limit.py
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` requests per second with bursts of ``burst``.
+
+    Usable from threads (`acquire`) and from asyncio code (`acquire_async`);
+    callers reserve a slot under a lock and then sleep outside of it.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class HostRateLimiter:
+    """One `TokenBucket` per host, so each site gets its own request budget."""
+
+    def __init__(self, rate: float, burst: int = 1, per_host: Optional[Dict[str, float]] = None) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.per_host = per_host or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower() or url
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.per_host.get(host, self.rate), self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> None:
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        await self.bucket(url).acquire_async()
@@ -0,0 +1,79 @@
+# common/scraper.py
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from common.csv_sink import CsvSink, read_csv_rows
+from common.seen_store import SeenStore, Watermark
+
+
+class Scraper:
+    """One job site: where its listings come from and how a detail row is built.
+
+    Subclasses set the class attributes and implement `iter_listings` and
+    `fetch_detail`; `run` is the list -> detail flow every site shares,
+    including ``--resume`` and ``--incremental``. `fetch_details` fetches
+    one job at a time; sites with a concurrent detail path override it.
+    """
+
+    name = ""
+    # Detail CSV columns and the listing/row field that identifies a job
+    fields: Sequence[str] = ()
+    key = "id"
+    list_csv = ""
+    detail_csv = ""
+    # Seen-ID store for incremental runs; sites without one always fetch everything
+    seen_file: Optional[str] = None
+    card_fields: Sequence[str] = ()
+
+    def iter_listings(self, watermark: Optional[Watermark] = None) -> Iterator[Dict]:
+        """Yield listing rows (newest first), saving them to ``list_csv``."""
+        raise NotImplementedError
+
+    def fetch_detail(self, listing: Dict) -> Optional[Dict]:
+        """Build the detail row for one listing; None if it couldn't be read."""
+        raise NotImplementedError
+
+    def fetch_details(self, listings: List[Dict], resume: bool = False,
+                      refresh: Iterable[str] = ()) -> int:
+        """Append detail rows to ``detail_csv``; returns the rows in the file.
+
+        With ``resume`` listings already in the file are skipped, except the
+        keys in ``refresh`` whose old rows are dropped first.
+        """
+        with CsvSink(self.detail_csv, self.fields, key=self.key, resume=resume, drop=refresh) as sink:
+            pending = [listing for listing in listings if listing[self.key] not in sink]
+            for idx, listing in enumerate(pending, 1):
+                try:
+                    row = self.fetch_detail(listing)
+                except Exception as exc:
+                    print(f"[WARN] Failed {listing[self.key]}: {exc}")
+                    continue
+                if row:
+                    sink.write(row)
+                    print(f"[{idx}/{len(pending)}] OK {listing[self.key]}")
+        print(f"[DONE] Saved {sink.rows} detailed jobs to {self.detail_csv}")
+        return sink.rows
+
+    def run(self, resume: bool = False, incremental: bool = False, stop_after: int = 0) -> int:
+        """List jobs, then fetch their details; returns the rows in ``detail_csv``."""
+        seen = SeenStore(self.seen_file, self.card_fields) if self.seen_file else None
+        watermark = Watermark(seen, stop_after) if seen and incremental and stop_after else None
+
+        listings = read_csv_rows(self.list_csv) if resume else []
+        if listings:
+            print(f"[INFO] Resuming with {len(listings)} jobs from {self.list_csv}")
+        else:
+            listings = list(self.iter_listings(watermark))
+        if not listings:
+            print("[INFO] No jobs collected; detail step skipped.")
+            return 0
+
+        refresh: List[str] = []
+        if incremental and seen is not None:
+            refresh = seen.changed_ids(listings, key=self.key)
+            new = sum(1 for listing in listings if listing[self.key] not in seen)
+            print(f"[INFO] Incremental run: {new} new and {len(refresh)} changed jobs")
+        rows = self.fetch_details(listings, resume=resume or incremental, refresh=refresh)
+        if seen is not None:
+            seen.update(listings, key=self.key)
+            seen.save()
+        return rows
@@ -0,0 +1,95 @@
+# common/seen_store.py
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+def card_hash(job: Dict, fields: Sequence[str]) -> str:
+    """Short fingerprint of the list-card fields that signal a changed posting."""
+    joined = "\x1f".join(str(job.get(field) or "").strip() for field in fields)
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()[:16]
+
+
+class SeenStore:
+    """Job IDs from earlier runs with a hash of their list card, kept as JSON.
+
+    Used for incremental crawls: a job whose card hash differs from the
+    stored one has been edited and its detail row needs fetching again.
+    """
+
+    def __init__(self, path: str, fields: Sequence[str]) -> None:
+        self.path = path
+        self.fields = tuple(fields)
+        self.hashes: Dict[str, str] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("fields") == list(self.fields):
+                    self.hashes = data.get("hashes", {})
+                else:
+                    print(f"[WARN] {path} was built from other card fields; ignoring it")
+            except (OSError, ValueError) as exc:
+                print(f"[WARN] Unreadable seen-ID store {path} ({exc}); ignoring it")
+
+    def __contains__(self, job_id) -> bool:
+        return str(job_id) in self.hashes
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def max_id(self) -> Optional[int]:
+        """Highest numeric job ID stored, the newest posting on both sites."""
+        ids = [int(job_id) for job_id in self.hashes if job_id.isdigit()]
+        return max(ids) if ids else None
+
+    def changed_ids(self, jobs: Iterable[Dict], key: str = "id") -> List[str]:
+        """IDs seen before whose card no longer hashes the same."""
+        return [
+            str(job[key]) for job in jobs
+            if str(job[key]) in self.hashes
+            and self.hashes[str(job[key])] != card_hash(job, self.fields)
+        ]
+
+    def update(self, jobs: Iterable[Dict], key: str = "id") -> None:
+        for job in jobs:
+            self.hashes[str(job[key])] = card_hash(job, self.fields)
+
+    def save(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fields": list(self.fields), "hashes": self.hashes}, f)
+        os.replace(tmp_path, self.path)
+
+
+class Watermark:
+    """Tells a newest-first listing crawl when it has reached known jobs.
+
+    A job is known if it is in the store or its numeric ID is at or below the
+    highest ID of the last run. After ``stop_after`` known IDs in a row the
+    rest of the list is assumed to be known as well; a new ID in between (a
+    bumped or pinned post) resets the run. ``stop_after=0`` never stops.
+    """
+
+    def __init__(self, store: SeenStore, stop_after: int) -> None:
+        self.store = store
+        self.stop_after = stop_after
+        self.high = store.max_id()
+        self.run = 0
+
+    def is_known(self, job_id) -> bool:
+        job_id = str(job_id)
+        if job_id in self.store:
+            return True
+        return self.high is not None and job_id.isdigit() and int(job_id) <= self.high
+
+    def reached(self, job_ids: Iterable) -> bool:
+        """Feed IDs in list order; True once the known run is long enough."""
+        if not self.stop_after:
+            return False
+        for job_id in job_ids:
+            self.run = self.run + 1 if self.is_known(job_id) else 0
+            if self.run >= self.stop_after:
+                return True
+        return False
@@ -0,0 +1,113 @@
+# common/tab_pool.py
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+# Chrome throttles timers and rendering in background tabs; the pool keeps
+# every tab busy, so start the browser with these when using it.
+TAB_POOL_CHROME_ARGS = (
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+)
+
+# Start a navigation without waiting for it. The flag lives on the old
+# window object, so readiness checks can't mistake the previous page for
+# the new one.
+NAVIGATE_JS = "window.__tabNavPending = true; window.location.href = arguments[0];"
+
+# True once the new page is loaded, shows ``selector`` and its DOM has been
+# still for ``quietMs``; the first successful check installs the observer.
+READY_JS = """
+var selector = arguments[0], quietMs = arguments[1];
+if (window.__tabNavPending) return false;
+if (document.readyState !== 'complete' || !document.querySelector(selector)) return false;
+var act = window.__tabActivity;
+if (!act) {
+    act = window.__tabActivity = {last: performance.now()};
+    new MutationObserver(function () { act.last = performance.now(); })
+        .observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    return false;
+}
+return performance.now() - act.last >= quietMs;
+"""
+
+
+class TabPool:
+    """Render pages in ``size`` tabs of one Chrome, keeping them all loading.
+
+    Navigations are started with JS so they don't block; the pool then
+    visits the tabs round-robin and hands back each page's HTML as soon as
+    it is ready, giving that tab the next queued URL. One browser process
+    serves every tab.
+    """
+
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        size: int,
+        ready_selector: str,
+        quiet: float = 1.0,
+        timeout: float = 30.0,
+        poll: float = 0.2,
+    ) -> None:
+        self.driver = driver
+        self.ready_selector = ready_selector
+        self.quiet = quiet
+        self.timeout = timeout
+        self.poll = poll
+        self.handles = [driver.current_window_handle]
+        for _ in range(size - 1):
+            driver.switch_to.new_window("tab")
+            self.handles.append(driver.current_window_handle)
+
+    def _start(self, handle: str, url: str) -> None:
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(NAVIGATE_JS, url)
+
+    def map(self, items: Iterable, url_of: Callable) -> Iterator[Tuple[object, Optional[str]]]:
+        """Yield ``(item, html)`` as pages finish, in completion order.
+
+        ``html`` is None when the page didn't become ready within ``timeout``
+        or the tab failed.
+        """
+        queue = deque(items)
+        active: Dict[str, Tuple[object, float]] = {}
+
+        def assign(handle: str) -> None:
+            while queue:
+                item = queue.popleft()
+                try:
+                    self._start(handle, url_of(item))
+                except WebDriverException as exc:
+                    print(f"[WARN] Couldn't open {url_of(item)}: {exc.msg}")
+                    continue
+                active[handle] = (item, time.monotonic())
+                return
+
+        for handle in self.handles:
+            assign(handle)
+
+        while active:
+            progressed = False
+            for handle in list(active):
+                item, started = active[handle]
+                html = None
+                try:
+                    self.driver.switch_to.window(handle)
+                    ready = self.driver.execute_script(READY_JS, self.ready_selector, self.quiet * 1000)
+                    if ready:
+                        html = self.driver.page_source
+                    elif time.monotonic() - started < self.timeout:
+                        continue
+                except WebDriverException as exc:
+                    print(f"[WARN] Tab failed on {url_of(item)}: {exc.msg}")
+                del active[handle]
+                progressed = True
+                yield item, html
+                assign(handle)
+            if not progressed:
+                time.sleep(self.poll)
@@ -0,0 +1,137 @@
+# common/waits.py
+import time
+from typing import Callable, Dict, List, Optional
+
+# Counts in-flight fetch/XHR requests and stamps the last DOM mutation, so
+# Python can tell when a page has gone quiet. Safe to run more than once.
+INSTALL_ACTIVITY_JS = """
+if (window.__pageActivity) return;
+var act = window.__pageActivity = {inflight: 0, lastChange: performance.now()};
+var done = function () { act.inflight = Math.max(0, act.inflight - 1); act.lastChange = performance.now(); };
+if (window.fetch) {
+    var origFetch = window.fetch;
+    window.fetch = function () {
+        act.inflight++;
+        return origFetch.apply(this, arguments).then(
+            function (r) { done(); return r; },
+            function (e) { done(); throw e; }
+        );
+    };
+}
+var origSend = XMLHttpRequest.prototype.send;
+XMLHttpRequest.prototype.send = function () {
+    act.inflight++;
+    this.addEventListener('loadend', done);
+    return origSend.apply(this, arguments);
+};
+new MutationObserver(function () { act.lastChange = performance.now(); })
+    .observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+"""
+
+ACTIVITY_JS = """
+var act = window.__pageActivity;
+if (!act) return null;
+return {inflight: act.inflight, idle: performance.now() - act.lastChange};
+"""
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class AdaptiveWaiter:
+    """Waits for a page to settle after an action instead of sleeping a fixed time.
+
+    `settle` returns once the optional ``progressed`` check passes, no
+    fetch/XHR is in flight and the DOM hasn't changed for ``quiet`` seconds.
+    It also returns, without progress, once the page has been that idle
+    for ``stall`` seconds or the optional ``exhausted`` check passes (say,
+    the load-more control is gone), so the last click doesn't wait out the
+    timeout. The timeout follows the observed latencies (a few times their
+    p90), and after a timeout the next waits back off exponentially until
+    the page answers in time again. Each wait's latency is kept for
+    `summary`.
+    """
+
+    def __init__(
+        self,
+        driver,
+        quiet: float = 0.4,
+        stall: float = 2.0,
+        poll: float = 0.1,
+        min_timeout: float = 10.0,
+        max_timeout: float = 60.0,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self.driver = driver
+        self.quiet = quiet
+        self.stall = max(stall, quiet)
+        self.poll = poll
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.max_backoff = max_backoff
+        self.latencies: List[float] = []
+        self.timeouts = 0
+        self.stalls = 0
+        self._backoff = 0.0
+
+    def install(self) -> None:
+        """Hook the page; call again after every full navigation."""
+        self.driver.execute_script(INSTALL_ACTIVITY_JS)
+
+    def timeout(self) -> float:
+        if len(self.latencies) < 5:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, 3 * _percentile(self.latencies, 90)))
+
+    def _activity(self) -> Optional[Dict]:
+        activity = self.driver.execute_script(ACTIVITY_JS)
+        if activity is None:  # page navigated and lost the hooks
+            self.install()
+        return activity
+
+    def settle(
+        self,
+        progressed: Optional[Callable[[], bool]] = None,
+        exhausted: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """Block until the page is quiet and has progressed; False if it never did."""
+        if self._backoff:
+            time.sleep(self._backoff)
+        started = time.monotonic()
+        deadline = started + self.timeout()
+        seen_progress = progressed is None
+        while time.monotonic() < deadline:
+            seen_progress = seen_progress or progressed()
+            activity = self._activity()
+            idle = (activity["idle"] / 1000
+                    if activity is not None and activity["inflight"] == 0 else 0.0)
+            if seen_progress and idle >= self.quiet:
+                self.latencies.append(time.monotonic() - started)
+                self._backoff = 0.0
+                return True
+            # Quiet since the action with nothing new: no more is coming, and
+            # that's not a slow server, so no timeout or backoff
+            quiet_for = min(idle, time.monotonic() - started)
+            if quiet_for >= self.stall or (
+                    exhausted is not None and quiet_for >= self.quiet and exhausted()):
+                self.stalls += 1
+                return False
+            time.sleep(self.poll)
+
+        self.timeouts += 1
+        self.latencies.append(time.monotonic() - started)
+        self._backoff = min(self.max_backoff, max(1.0, self._backoff * 2))
+        print(f"[WARN] Page didn't settle within {deadline - started:.0f}s; "
+              f"backing off {self._backoff:.0f}s before the next wait")
+        return False
+
+    def summary(self) -> str:
+        if not self.latencies:
+            return f"no waits recorded, {self.stalls} without progress"
+        return (
+            f"{len(self.latencies)} waits, p50 {_percentile(self.latencies, 50):.2f}s, "
+            f"p90 {_percentile(self.latencies, 90):.2f}s, max {max(self.latencies):.2f}s, "
+            f"{self.timeouts} timeouts, {self.stalls} without progress"
+        )
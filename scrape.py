@@ -0,0 +1,156 @@
+# scrape.py
+# Run any of the site scrapers at once, each in its own process, so a full
+# run takes as long as the slowest site. Usage:
+#   python scrape.py [jobify] [bongthom] [camhr] [--resume] [--combined all_jobs.csv]
+import argparse
+import csv
+import importlib
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Tuple
+
+from common.cli import add_common_args
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+# Site name -> (folder, module, `common.scraper.Scraper` subclass)
+SITES = {
+    "jobify": ("Jobify", "main", "JobifyScraper"),
+    "bongthom": ("BongThom", "bongthom", "BongThomScraper"),
+    "camhr": ("chmhr", "camhr", "CamHRScraper"),
+}
+
+
+class _Prefixed:
+    """Stream wrapper that tags every line with the site it came from."""
+
+    def __init__(self, stream, prefix: str) -> None:
+        self.stream = stream
+        self.prefix = prefix
+        self._line_start = True
+
+    def write(self, text: str) -> int:
+        for piece in text.splitlines(keepends=True):
+            if self._line_start:
+                self.stream.write(self.prefix)
+            self.stream.write(piece)
+            self._line_start = piece.endswith("\n")
+        return len(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def _run_site(site: str, args: argparse.Namespace) -> Tuple[str, int, float, str]:
+    """Worker process: run one site; returns (site, rows, seconds, detail CSV path)."""
+    folder, module_name, class_name = SITES[site]
+    site_dir = REPO_ROOT / folder
+    # Sites import their siblings by bare name and keep their CSVs next to the code
+    os.chdir(site_dir)
+    sys.path[:0] = [str(site_dir), str(REPO_ROOT)]
+    sys.stdout = _Prefixed(sys.stdout, f"[{site}] ")
+    sys.stderr = _Prefixed(sys.stderr, f"[{site}] ")
+
+    from common.cli import apply_common_args
+
+    apply_common_args(args)
+
+    scraper = getattr(importlib.import_module(module_name), class_name)()
+    started = time.monotonic()
+    rows = scraper.run(
+        resume=args.resume,
+        incremental=args.incremental,
+        stop_after=args.stop_after,
+    )
+    sys.stdout.flush()
+    return site, rows, time.monotonic() - started, str(site_dir / scraper.detail_csv)
+
+
+def _merge_details(outputs: List[Tuple[str, str]], path: str) -> None:
+    """Write every site's detail rows to one CSV, tagged with a ``site`` column."""
+    sys.path.insert(0, str(REPO_ROOT))
+    from common.csv_sink import read_csv_rows
+
+    fieldnames = ["site"]
+    tables = []
+    for site, detail_csv in outputs:
+        rows = read_csv_rows(detail_csv)
+        for row in rows[:1]:
+            fieldnames += [name for name in row if name not in fieldnames]
+        tables.append((site, rows))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for site, rows in tables:
+            writer.writerows({"site": site, **row} for row in rows)
+    os.replace(tmp_path, path)
+    print(f"[OK] Wrote {sum(len(rows) for _, rows in tables)} rows -> {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scrape several job sites concurrently.")
+    parser.add_argument(
+        "sites", nargs="*", metavar="SITE",
+        help=f"sites to run (default: all of {', '.join(SITES)})",
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="reuse the saved job lists and only fetch details missing from the CSVs",
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="keep existing detail rows; fetch only new jobs and jobs whose card changed",
+    )
+    parser.add_argument(
+        "--stop-after", type=int, default=0, metavar="N",
+        help="with --incremental, stop listing after N consecutive already-known jobs",
+    )
+    parser.add_argument(
+        "--combined", metavar="CSV",
+        help="also write every site's detail rows to this CSV, with a site column",
+    )
+    add_common_args(parser)
+    args = parser.parse_args()
+    if args.stop_after and not args.incremental:
+        parser.error("--stop-after only applies to --incremental runs")
+    unknown = sorted(set(args.sites) - set(SITES))
+    if unknown:
+        parser.error(f"unknown site(s): {', '.join(unknown)} (choose from {', '.join(SITES)})")
+    sites = list(dict.fromkeys(args.sites)) or list(SITES)
+
+    print(f"[INFO] Running {', '.join(sites)} in {len(sites)} process(es)")
+    started = time.monotonic()
+    outputs, busy, failed = [], 0.0, []
+    # spawn: a clean interpreter per site, the same on Windows and POSIX
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(sites), mp_context=context) as executor:
+        futures = {executor.submit(_run_site, site, args): site for site in sites}
+        for future in as_completed(futures):
+            site = futures[future]
+            try:
+                site, rows, elapsed, detail_csv = future.result()
+            except Exception as exc:
+                print(f"[ERROR] {site} failed: {exc!r}")
+                failed.append(site)
+                continue
+            busy += elapsed
+            outputs.append((site, detail_csv))
+            print(f"[OK] {site}: {rows} detail rows in {elapsed:.0f}s")
+
+    wall = time.monotonic() - started
+    print(f"[DONE] {len(outputs)}/{len(sites)} sites in {wall:.0f}s "
+          f"({busy:.0f}s if run one after another)")
+    if args.combined and outputs:
+        _merge_details(sorted(outputs), args.combined)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()